@@ -0,0 +1,180 @@
+"""
+Concurrency benchmark for POST /applications/accept: many simultaneous accepts on a project's roles.
+
+Needs DATABASE_URL pointing at a disposable database. Run from bt/:
+    python -m benchmarks.accept_concurrency --accepts 100 --slots 10
+    python -m benchmarks.accept_concurrency --accepts 100 --slots 2 --roles 5
+
+Seeds throwaway users, a project with `roles` roles of `slots` slots each and one pending
+application per applicant, spread round-robin over the roles. Fires every accept at once
+through the ASGI app and checks that each role has exactly min(slots, its applicants)
+winners and ends at slots_filled <= slots_available, and that the project counters and
+is_fully_staffed agree. With several roles filling at once this exercises the staffing
+recompute across roles. The seeded rows are deleted afterwards.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+
+import httpx
+from sqlalchemy import select, delete, func
+
+from database.initialization import AsyncSessionLocal
+from database.schemas import (
+    UserModel, UserProfileModel, SkillModel, ProjectModel, ProjectRoleModel,
+    ProjectMemberModel, ApplicationModel, ProjectTypeEnum, PaymentTypeEnum, MemberRoleEnum
+)
+from utils.auth import create_tokens
+from main import app
+
+
+async def seed(accepts: int, slots: int, roles: int):
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as db:
+        skill = SkillModel(name=f"bench-{tag}")
+        users = [
+            UserModel(email=f"bench-{tag}-{i}@example.com", hashed_password="-", is_verified=True)
+            for i in range(accepts + 1)
+        ]
+        db.add(skill)
+        db.add_all(users)
+        await db.flush()
+        creator, applicants = users[0], users[1:]
+        db.add_all([UserProfileModel(user_id=user.id, name=f"Bench {i}") for i, user in enumerate(users)])
+
+        project = ProjectModel(
+            creator_id=creator.id,
+            name=f"bench-{tag}",
+            project_type=ProjectTypeEnum.OTHER,
+            member_count=1,
+            open_slots=slots * roles,
+            pending_applications=accepts
+        )
+        db.add(project)
+        await db.flush()
+        project_roles = [
+            ProjectRoleModel(
+                project_id=project.id,
+                skill_id=skill.id,
+                role_title=f"Bench role {i}",
+                slots_available=slots,
+                payment_type=PaymentTypeEnum.UNPAID
+            )
+            for i in range(roles)
+        ]
+        db.add_all(project_roles)
+        db.add(ProjectMemberModel(project_id=project.id, user_id=creator.id, member_role=MemberRoleEnum.ADMIN))
+        await db.flush()
+        applications = [
+            ApplicationModel(project_id=project.id, role_id=project_roles[i % roles].id, applicant_id=user.id)
+            for i, user in enumerate(applicants)
+        ]
+        db.add_all(applications)
+        await db.commit()
+
+        tokens = await create_tokens(creator.id, db)
+        return {
+            "skill_id": skill.id,
+            "user_ids": [user.id for user in users],
+            "project_id": project.id,
+            "role_ids": [role.id for role in project_roles],
+            "application_ids": [application.id for application in applications],
+            "token": tokens["access_token"],
+        }
+
+
+async def cleanup(seeded):
+    async with AsyncSessionLocal() as db:
+        # Roles, applications and members go with the project (ON DELETE CASCADE)
+        await db.execute(delete(ProjectModel).where(ProjectModel.id == seeded["project_id"]))
+        await db.execute(delete(UserModel).where(UserModel.id.in_(seeded["user_ids"])))
+        await db.execute(delete(SkillModel).where(SkillModel.id == seeded["skill_id"]))
+        await db.commit()
+
+
+async def fire(seeded):
+    headers = {"Authorization": f"Bearer {seeded['token']}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def accept(application_id):
+            started = time.perf_counter()
+            response = await client.post(f"/applications/accept/{application_id}", headers=headers)
+            return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(accept(application_id) for application_id in seeded["application_ids"]))
+        return results, time.perf_counter() - started
+
+
+async def check(seeded, slots: int, statuses: Counter) -> list[str]:
+    async with AsyncSessionLocal() as db:
+        roles = (await db.execute(
+            select(ProjectRoleModel).where(ProjectRoleModel.id.in_(seeded["role_ids"]))
+        )).scalars().all()
+        project = (await db.execute(
+            select(ProjectModel).where(ProjectModel.id == seeded["project_id"])
+        )).scalar_one()
+        members = (await db.execute(
+            select(func.count()).where(ProjectMemberModel.project_id == seeded["project_id"])
+        )).scalar_one()
+
+    # Applicants were dealt round-robin, so role i got every len(roles)-th of them
+    applicants = len(seeded["application_ids"])
+    wins_by_role = [
+        min(slots, len(range(i, applicants, len(seeded["role_ids"]))))
+        for i in range(len(seeded["role_ids"]))
+    ]
+    filled_by_role = {role.id: role for role in roles}
+    expected_wins = sum(wins_by_role)
+    checks = {
+        f"{expected_wins} accepts succeeded": statuses[200] == expected_wins,
+        "the rest got 400": statuses[400] == applicants - expected_wins,
+        "slots_filled matches the winners on every role": all(
+            filled_by_role[role_id].slots_filled == wins
+            for role_id, wins in zip(seeded["role_ids"], wins_by_role)
+        ),
+        "roles marked filled exactly when full": all(
+            role.is_filled == (role.slots_filled == role.slots_available) for role in roles
+        ),
+        "project marked fully staffed": project.is_fully_staffed == all(role.is_filled for role in roles),
+        "member rows match": members == 1 + expected_wins,
+        "member_count counter": project.member_count == members,
+        "open_slots counter": project.open_slots == sum(
+            role.slots_available - role.slots_filled for role in roles
+        ),
+    }
+    for name, passed in checks.items():
+        print(f"  {'✅' if passed else '❌'} {name}")
+    return [name for name, passed in checks.items() if not passed]
+
+
+async def main(accepts: int, slots: int, roles: int):
+    seeded = await seed(accepts, slots, roles)
+    try:
+        results, elapsed = await fire(seeded)
+        statuses = Counter(status for status, _ in results)
+        latencies = sorted(latency for _, latency in results)
+
+        print(f"{accepts} concurrent accepts on {roles} role(s) with {slots} slots each")
+        print(f"  wall time   {elapsed * 1000:.0f} ms")
+        print(f"  latency p50 {statistics.median(latencies) * 1000:.0f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f} ms, "
+              f"max {latencies[-1] * 1000:.0f} ms")
+        print(f"  statuses    {dict(statuses)}")
+        failed = await check(seeded, slots, statuses)
+    finally:
+        await cleanup(seeded)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--accepts", type=int, default=100)
+    parser.add_argument("--slots", type=int, default=10, help="slots per role")
+    parser.add_argument("--roles", type=int, default=1)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.accepts, args.slots, args.roles)))
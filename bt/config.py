@@ -16,4 +16,12 @@ REFRESH_TOKEN_EXPIRE_DAYS = 30
 FRONTEND_LINK = "http://localhost:3000"
 
 SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
\ No newline at end of file
+SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 60
+SEARCH_STREAM_BATCH_SIZE = 500
+COUNTER_RECONCILE_INTERVAL_SECONDS = 3600
+IMPORT_CHUNK_SIZE = 500
+REVIEW_BATCH_SIZE = 500
+SEARCH_MAX_SKILL_IDS = 20
\ No newline at end of file
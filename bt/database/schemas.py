@@ -125,6 +125,12 @@ class UserProfileModel(Base):
     
     __table_args__ = (
         Index('idx_user_profile_location', 'latitude', 'longitude'),
+        Index('idx_user_profile_no_location', 'id', postgresql_where=text("latitude IS NULL OR longitude IS NULL")),
+        # Trigram indexes serve ILIKE '%...%' and similarity ranking (needs pg_trgm)
+        Index('idx_user_profile_name_trgm', 'name',
+              postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('idx_user_profile_profession_trgm', 'profession',
+              postgresql_using='gin', postgresql_ops={'profession': 'gin_trgm_ops'}),
     )
 
 
@@ -157,6 +163,11 @@ class ProjectModel(Base):
     is_fully_staffed = Column(Boolean, default=False, nullable=False, index=True)
     last_status_update = Column(DateTime(timezone=True))
     
+    # Denormalized counters, kept in step by the write paths and reconciled periodically
+    member_count = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    open_slots = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    pending_applications = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    
     city = Column(String(255))
     state = Column(String(255))
     country = Column(String(255))
@@ -174,7 +185,11 @@ class ProjectModel(Base):
     
     __table_args__ = (
         Index('idx_project_visibility', 'status', 'is_fully_staffed'),
+        # Visibility prefix plus the browse sort keys, so keyset pages are index range scans
+        Index('idx_project_browse_created', 'status', 'is_fully_staffed', 'created_at', 'id'),
+        Index('idx_project_browse_updated', 'status', 'is_fully_staffed', 'last_status_update', 'id'),
         Index('idx_project_location', 'latitude', 'longitude'),
+        Index('idx_project_no_location', 'id', postgresql_where=text("latitude IS NULL OR longitude IS NULL")),
     )
 
 
@@ -223,6 +238,9 @@ class ApplicationModel(Base):
     
     __table_args__ = (
         Index('idx_application_lookup', 'project_id', 'applicant_id'),
+        Index('idx_application_review', 'project_id', 'status', 'applied_at', 'id'),
+        Index('idx_application_queue', 'project_id', 'applied_at', 'id'),
+        Index('idx_application_applicant', 'applicant_id', 'applied_at', 'id'),
         Index('idx_application_unique', 'role_id', 'applicant_id', unique=True),
     )
 
@@ -295,6 +313,7 @@ class RefreshTokenModel(Base):
 
 async def create_tables():
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
     print("✅ Tables created in Supabase!")
 
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import traceback
+import asyncio
 
 # Import routers
 from routers.auth import router as authrouter
@@ -13,6 +14,10 @@ from routers.management import router as managementrouter
 from routers.chat import router as chatrouter
 from routers.skills import router as skillrouter
 from routers.upload import router as uploadrouter
+from database.initialization import AsyncSessionLocal
+from utils.search_indexes import INDEX_LOADERS
+from utils.project_counters import reconcile_project_counters
+from config import COUNTER_RECONCILE_INTERVAL_SECONDS
 
 # Create FastAPI app
 app = FastAPI(
@@ -100,8 +105,28 @@ app.include_router(uploadrouter)
 
 # ===================== LIFECYCLE EVENTS =====================
 
+async def reconcile_counters_forever():
+    """Recount project counters at startup and then on a fixed interval"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await reconcile_project_counters(db)
+        except Exception as e:
+            print(f"⚠️  Counter reconciliation failed: {e}")
+        await asyncio.sleep(COUNTER_RECONCILE_INTERVAL_SECONDS)
+
 @app.on_event("startup")
 async def startup_event():
+    # In-memory search indexes; search falls back to SQL until they are loaded
+    for load_index in INDEX_LOADERS:
+        try:
+            async with AsyncSessionLocal() as db:
+                await load_index(db)
+        except Exception as e:
+            print(f"⚠️  {load_index.__name__} failed: {e}")
+    
+    app.state.counter_reconciler = asyncio.create_task(reconcile_counters_forever())
+    
     print("=" * 60)
     print("🎬 FilmCrew API Started Successfully!")
     print("=" * 60)
@@ -123,6 +148,7 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    app.state.counter_reconciler.cancel()
     print("=" * 60)
     print("👋 FilmCrew API Shutting Down...")
     print("=" * 60)
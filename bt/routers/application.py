@@ -1,15 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, and_, update, exists, insert, values, column, tuple_, literal, true, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from database.initialization import get_db
 from database.schemas import (
     ApplicationModel, ProjectRoleModel, ProjectMemberModel, ProjectModel,
     ApplicationStatusEnum, MemberRoleEnum, UserProfileModel
 )
 from utils.auth import get_current_user
-from pydantic import BaseModel
+from utils import search_indexes
+from utils.candidates import crew_candidates
+from utils.project_counters import counter_update, staffing_update
+from utils.skill_facets import skill_facets
+from utils.pagination import keyset_page, split_page, NEXT_CURSOR_HEADER
+from config import REVIEW_BATCH_SIZE
+from pydantic import BaseModel, Field
+from typing import Literal
 from uuid import UUID
 from datetime import datetime, timezone
+from collections import Counter
+import numpy as np
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
@@ -28,81 +41,203 @@ class ApplicationResponse(BaseModel):
     applied_at: str
     reviewed_at: str | None
 
+class ApplicantSummary(BaseModel):
+    profile_id: str
+    name: str
+    profession: str | None
+    city: str | None
+    country: str | None
+    years_of_experience: int | None
+    profile_photo_url: str | None
+
+class ProjectApplicationResponse(ApplicationResponse):
+    applicant: ApplicantSummary | None
+
+class MyApplicationResponse(BaseModel):
+    id: str
+    project_id: str
+    project_name: str
+    project_type: str
+    project_status: str
+    role_id: str
+    role_title: str
+    cover_letter: str | None
+    status: str
+    applied_at: str
+    reviewed_at: str | None
+
+class ReviewDecision(BaseModel):
+    application_id: UUID
+    decision: Literal["accept", "reject"]
+
+class ReviewRequest(BaseModel):
+    decisions: list[ReviewDecision] = Field(..., min_length=1, max_length=REVIEW_BATCH_SIZE)
+
+class ReviewResult(BaseModel):
+    application_id: str
+    decision: str
+    status_code: int
+    detail: str
+
 @router.post("/apply", status_code=status.HTTP_201_CREATED, response_model=ApplicationResponse)
 async def apply_to_role(
     request: ApplyRequest,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    # Check if user has profile
-    result = await db.execute(
-        select(UserProfileModel).where(UserProfileModel.user_id == current_user.id)
+    """
+    Apply in one round trip: profile, role and project are read by the statement that
+    inserts, and the row it returns tells which check failed when nothing was inserted.
+    """
+    profile = (
+        select(UserProfileModel.name)
+        .where(UserProfileModel.user_id == current_user.id)
+        .cte("profile")
     )
-    profile = result.scalar_one_or_none()
-    if not profile:
-        raise HTTPException(400, "Create profile first")
-    
-    # Check if role exists and not filled
-    result = await db.execute(
-        select(ProjectRoleModel).where(ProjectRoleModel.id == request.role_id)
+    role = (
+        select(ProjectRoleModel.project_id, ProjectRoleModel.is_filled, ProjectModel.creator_id)
+        .join(ProjectModel, ProjectModel.id == ProjectRoleModel.project_id)
+        .where(ProjectRoleModel.id == request.role_id)
+        .cte("role")
     )
-    role = result.scalar_one_or_none()
-    if not role:
-        raise HTTPException(404, "Role not found")
-    if role.is_filled:
-        raise HTTPException(400, "Role is already filled")
     
-    # Check if already applied
-    result = await db.execute(
-        select(ApplicationModel).where(
-            and_(
-                ApplicationModel.role_id == request.role_id,
-                ApplicationModel.applicant_id == current_user.id
+    # Open role, not the applicant's own project; the unique (role_id, applicant_id)
+    # index turns a duplicate into an empty insert instead of an error
+    inserted = (
+        pg_insert(ApplicationModel)
+        .from_select(
+            ["project_id", "role_id", "applicant_id", "cover_letter"],
+            select(
+                role.c.project_id,
+                literal(request.role_id, ApplicationModel.role_id.type),
+                literal(current_user.id, ApplicationModel.applicant_id.type),
+                literal(request.cover_letter, ApplicationModel.cover_letter.type)
             )
+            .select_from(role.join(profile, true()))
+            .where(role.c.is_filled == False, role.c.creator_id != current_user.id)
+        )
+        .on_conflict_do_nothing(index_elements=["role_id", "applicant_id"])
+        .returning(
+            ApplicationModel.id,
+            ApplicationModel.project_id,
+            ApplicationModel.status,
+            ApplicationModel.applied_at
         )
+        .cte("inserted")
     )
-    if result.scalar_one_or_none():
-        raise HTTPException(400, "Already applied to this role")
+    counted = counter_update(inserted.c.project_id, pending_applications=1).cte("counted")
     
-    # Check if user is creator
+    # One row whatever happened: missing CTE rows come back as NULLs
+    one = values(column("one", Integer), name="one").data([(1,)])
     result = await db.execute(
-        select(ProjectModel).where(ProjectModel.id == role.project_id)
+        select(
+            profile.c.name,
+            role.c.is_filled,
+            role.c.creator_id,
+            inserted.c.id,
+            inserted.c.project_id,
+            inserted.c.status,
+            inserted.c.applied_at
+        )
+        .select_from(
+            one.outerjoin(profile, true()).outerjoin(role, true()).outerjoin(inserted, true())
+        )
+        .add_cte(counted)
     )
+    row = result.one()
     
-    project = result.scalar_one_or_none()
-    if project.creator_id == current_user.id:
-        raise HTTPException(400, "Cannot apply to your own project")
-    
-    # Create application
-    application = ApplicationModel(
-        project_id=role.project_id,
-        role_id=request.role_id,
-        applicant_id=current_user.id,
-        cover_letter=request.cover_letter
-    )
+    if row.name is None:
+        raise HTTPException(400, "Create profile first")
+    if row.creator_id is None:
+        raise HTTPException(404, "Role not found")
+    if row.id is None:
+        if row.is_filled:
+            raise HTTPException(400, "Role is already filled")
+        if row.creator_id == current_user.id:
+            raise HTTPException(400, "Cannot apply to your own project")
+        raise HTTPException(400, "Already applied to this role")
     
-    db.add(application)
     await db.commit()
-    await db.refresh(application)
     
     return ApplicationResponse(
-        id=str(application.id),
-        project_id=str(application.project_id),
-        role_id=str(application.role_id),
-        applicant_id=str(application.applicant_id),
-        applicant_name=profile.name,
-        cover_letter=application.cover_letter,
-        status=application.status.value,
-        applied_at=application.applied_at.isoformat(),
+        id=str(row.id),
+        project_id=str(row.project_id),
+        role_id=str(request.role_id),
+        applicant_id=str(current_user.id),
+        applicant_name=row.name,
+        cover_letter=request.cover_letter,
+        status=row.status.value,
+        applied_at=row.applied_at.isoformat(),
         reviewed_at=None
     )
 
-@router.get("/project/{project_id}", response_model=list[ApplicationResponse])
+@router.get("/my", response_model=list[MyApplicationResponse])
+async def get_my_applications(
+    status: ApplicationStatusEnum | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    response: Response = None,
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    The caller's applications, newest first, with project and role details.
+    Filter by status; the next page's cursor is in X-Next-Cursor.
+    """
+    query = (
+        select(
+            ApplicationModel,
+            ProjectModel.name,
+            ProjectModel.project_type,
+            ProjectModel.status.label("project_status"),
+            ProjectRoleModel.role_title
+        )
+        .join(ProjectModel, ProjectModel.id == ApplicationModel.project_id)
+        .join(ProjectRoleModel, ProjectRoleModel.id == ApplicationModel.role_id)
+        .where(ApplicationModel.applicant_id == current_user.id)
+    )
+    if status:
+        query = query.where(ApplicationModel.status == status)
+    
+    # Descending (applied_at, id) keyset, served by idx_application_applicant
+    sort_keys = [ApplicationModel.applied_at, ApplicationModel.id]
+    result = await db.execute(keyset_page(query, sort_keys, cursor, limit, descending=True))
+    rows, next_cursor = split_page(result.all(), limit, len(sort_keys))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return [
+        MyApplicationResponse(
+            id=str(app.id),
+            project_id=str(app.project_id),
+            project_name=project_name,
+            project_type=project_type.value,
+            project_status=project_status.value,
+            role_id=str(app.role_id),
+            role_title=role_title,
+            cover_letter=app.cover_letter,
+            status=app.status.value,
+            applied_at=app.applied_at.isoformat(),
+            reviewed_at=app.reviewed_at.isoformat() if app.reviewed_at else None
+        )
+        for app, project_name, project_type, project_status, role_title, *_ in rows
+    ]
+
+@router.get("/project/{project_id}", response_model=list[ProjectApplicationResponse])
 async def get_project_applications(
     project_id: UUID,
+    status: ApplicationStatusEnum | None = Query(None),
+    role_id: UUID | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    response: Response = None,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    """
+    Review queue of a project, oldest application first, with the applicant's profile
+    summary. Filter by status and role_id; the next page's cursor is in X-Next-Cursor.
+    """
     # Check if user is project creator or parent/admin
     result = await db.execute(
         select(ProjectModel).where(ProjectModel.id == project_id)
@@ -124,20 +259,27 @@ async def get_project_applications(
         if not result.scalar_one_or_none():
             raise HTTPException(403, "Not authorized")
     
-    # Get applications
-    result = await db.execute(
-        select(ApplicationModel).where(ApplicationModel.project_id == project_id)
+    # Get applications with applicant profiles in one query
+    query = (
+        select(ApplicationModel, UserProfileModel)
+        .outerjoin(UserProfileModel, UserProfileModel.user_id == ApplicationModel.applicant_id)
+        .where(ApplicationModel.project_id == project_id)
     )
-    applications = result.scalars().all()
+    if status:
+        query = query.where(ApplicationModel.status == status)
+    if role_id:
+        query = query.where(ApplicationModel.role_id == role_id)
     
-    response = []
-    for app in applications:
-        result = await db.execute(
-            select(UserProfileModel).where(UserProfileModel.user_id == app.applicant_id)
-        )
-        profile = result.scalar_one_or_none()
-        
-        response.append(ApplicationResponse(
+    # (applied_at, id) keyset, served by idx_application_review with a status filter
+    # and by idx_application_queue without one
+    sort_keys = [ApplicationModel.applied_at, ApplicationModel.id]
+    result = await db.execute(keyset_page(query, sort_keys, cursor, limit))
+    rows, next_cursor = split_page(result.all(), limit, len(sort_keys))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return [
+        ProjectApplicationResponse(
             id=str(app.id),
             project_id=str(app.project_id),
             role_id=str(app.role_id),
@@ -146,10 +288,105 @@ async def get_project_applications(
             cover_letter=app.cover_letter,
             status=app.status.value,
             applied_at=app.applied_at.isoformat(),
-            reviewed_at=app.reviewed_at.isoformat() if app.reviewed_at else None
-        ))
+            reviewed_at=app.reviewed_at.isoformat() if app.reviewed_at else None,
+            applicant=ApplicantSummary(
+                profile_id=str(profile.id),
+                name=profile.name,
+                profession=profile.profession,
+                city=profile.city,
+                country=profile.country,
+                years_of_experience=profile.years_of_experience,
+                profile_photo_url=profile.profile_photo_url
+            ) if profile else None
+        )
+        for app, profile, *_ in rows
+    ]
+
+@router.get("/role/{role_id}/candidates")
+async def get_role_candidates(
+    role_id: UUID,
+    limit: int = Query(20, ge=1, le=100),
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Recommend crew who have not applied to a role: scored by skill match (the role's
+    skill or one from its category), distance, experience and availability.
+    """
+    
+    # Get role and project
+    result = await db.execute(
+        select(ProjectRoleModel, ProjectModel)
+        .join(ProjectModel, ProjectModel.id == ProjectRoleModel.project_id)
+        .where(ProjectRoleModel.id == role_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(404, "Role not found")
+    role, project = row
+    
+    if project.creator_id != current_user.id:
+        result = await db.execute(
+            select(ProjectMemberModel).where(
+                and_(
+                    ProjectMemberModel.project_id == project.id,
+                    ProjectMemberModel.user_id == current_user.id,
+                    ProjectMemberModel.member_role.in_([MemberRoleEnum.ADMIN, MemberRoleEnum.PARENT])
+                )
+            )
+        )
+        if not result.scalar_one_or_none():
+            raise HTTPException(403, "Not authorized")
+    
+    if not crew_candidates.loaded:
+        raise HTTPException(503, "Candidate index is not ready")
+    
+    # Applicants to the role and the project's own members are not candidates
+    result = await db.execute(
+        select(ApplicationModel.applicant_id).where(ApplicationModel.role_id == role_id)
+        .union(select(ProjectMemberModel.user_id).where(ProjectMemberModel.project_id == project.id))
+    )
+    exclude_user_ids = set(result.scalars().all())
+    exclude_user_ids.add(project.creator_id)
+    
+    category = skill_facets.skills.get(role.skill_id, {}).get("category")
+    related_skill_ids = [
+        skill_id for skill_id, skill in skill_facets.skills.items()
+        if category and skill["category"] == category and skill_id != role.skill_id
+    ]
+    
+    profile_ids, scores, distances, available = crew_candidates.rank(
+        role.skill_id, related_skill_ids, project.latitude, project.longitude, exclude_user_ids, limit
+    )
+    if not profile_ids:
+        return []
     
-    return response
+    result = await db.execute(
+        select(UserProfileModel)
+        .options(selectinload(UserProfileModel.skills))
+        .where(UserProfileModel.id.in_(profile_ids))
+    )
+    profiles = {profile.id: profile for profile in result.scalars()}
+    
+    return [
+        {
+            "profile_id": str(profile.id),
+            "user_id": str(profile.user_id),
+            "name": profile.name,
+            "profession": profile.profession,
+            "city": profile.city,
+            "state": profile.state,
+            "country": profile.country,
+            "years_of_experience": profile.years_of_experience,
+            "profile_photo_url": profile.profile_photo_url,
+            "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in profile.skills],
+            "distance_km": None if np.isnan(distance) else round(float(distance), 2),
+            "available": bool(is_available),
+            "score": round(float(score), 4)
+        }
+        for profile_id, score, distance, is_available in zip(profile_ids, scores, distances, available)
+        if (profile := profiles.get(profile_id))
+    ]
 
 @router.post("/accept/{application_id}")
 async def accept_application(
@@ -186,43 +423,75 @@ async def accept_application(
     if application.status != ApplicationStatusEnum.PENDING:
         raise HTTPException(400, "Application already processed")
     
-    # Get role
+    # An applicant joins a project once, even if they applied for two of its roles
     result = await db.execute(
-        select(ProjectRoleModel).where(ProjectRoleModel.id == application.role_id)
+        select(exists().where(
+            ProjectMemberModel.project_id == application.project_id,
+            ProjectMemberModel.user_id == application.applicant_id
+        ))
     )
-    role = result.scalar_one_or_none()
+    if result.scalar():
+        raise HTTPException(400, "Applicant is already a project member")
     
-    if role.slots_filled >= role.slots_available:
-        raise HTTPException(400, "No slots available")
+    # Claim the application; a concurrent accept/reject of it matches no row
+    result = await db.execute(
+        update(ApplicationModel)
+        .where(
+            ApplicationModel.id == application_id,
+            ApplicationModel.status == ApplicationStatusEnum.PENDING
+        )
+        .values(status=ApplicationStatusEnum.ACCEPTED, reviewed_at=datetime.now(timezone.utc))
+        .returning(ApplicationModel.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(400, "Application already processed")
     
-    # Accept application
-    application.status = ApplicationStatusEnum.ACCEPTED
-    application.reviewed_at = datetime.now(timezone.utc)
+    # Reserve a slot in one conditional UPDATE; the row lock serializes concurrent
+    # accepts on the role, so slots_filled can never pass slots_available
+    result = await db.execute(
+        update(ProjectRoleModel)
+        .where(
+            ProjectRoleModel.id == application.role_id,
+            ProjectRoleModel.slots_filled < ProjectRoleModel.slots_available
+        )
+        .values(
+            slots_filled=ProjectRoleModel.slots_filled + 1,
+            is_filled=ProjectRoleModel.slots_filled + 1 >= ProjectRoleModel.slots_available
+        )
+        .returning(ProjectRoleModel)
+    )
+    role = result.scalar_one_or_none()
+    if role is None:
+        await db.rollback()
+        raise HTTPException(400, "No slots available")
     
-    # Add as project member
-    member = ProjectMemberModel(
+    # Add as project member; the unique (project_id, user_id) index catches a
+    # concurrent accept of the same applicant for another role
+    db.add(ProjectMemberModel(
         project_id=application.project_id,
         user_id=application.applicant_id,
         role_id=application.role_id,
         member_role=MemberRoleEnum.CHILD
-    )
-    db.add(member)
+    ))
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(400, "Applicant is already a project member")
     
-    # Update role slots
-    role.slots_filled += 1
-    if role.slots_filled >= role.slots_available:
-        role.is_filled = True
-    
-    # Check if all roles filled
-    result = await db.execute(
-        select(ProjectRoleModel).where(ProjectRoleModel.project_id == application.project_id)
+    # The counter UPDATE takes the project row lock only now, so accepts on different
+    # roles overlap until here; staffing is then recomputed while holding it
+    await db.execute(
+        counter_update(project.id, pending_applications=-1, member_count=1, open_slots=-1)
     )
-    all_roles = result.scalars().all()
-    if all(r.is_filled for r in all_roles):
-        project.is_fully_staffed = True
-    
+    result = await db.execute(staffing_update(project.id))
+    # Mirror the result without dirtying the object, which would re-issue the UPDATE
+    set_committed_value(project, "is_fully_staffed", result.scalar_one())
     await db.commit()
     
+    search_indexes.role_slots_changed(project, role, -1)
+    search_indexes.member_joined(project, application.applicant_id)
+    
     return {"message": "Application accepted"}
 
 @router.post("/reject/{application_id}")
@@ -260,9 +529,212 @@ async def reject_application(
     if application.status != ApplicationStatusEnum.PENDING:
         raise HTTPException(400, "Application already processed")
     
-    application.status = ApplicationStatusEnum.REJECTED
-    application.reviewed_at = datetime.now(timezone.utc)
+    # Claim the application like accept does; a concurrent accept/reject of it matches no row
+    result = await db.execute(
+        update(ApplicationModel)
+        .where(
+            ApplicationModel.id == application_id,
+            ApplicationModel.status == ApplicationStatusEnum.PENDING
+        )
+        .values(status=ApplicationStatusEnum.REJECTED, reviewed_at=datetime.now(timezone.utc))
+        .returning(ApplicationModel.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(400, "Application already processed")
+    await db.execute(counter_update(project.id, pending_applications=-1))
     
     await db.commit()
     
-    return {"message": "Application rejected"}
\ No newline at end of file
+    return {"message": "Application rejected"}
+
+@router.post("/review", response_model=list[ReviewResult])
+async def review_applications(
+    request: ReviewRequest,
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Accept or reject many applications in one transaction. Every item gets the status
+    code and message the single accept/reject endpoints would have returned for it.
+    """
+    outcomes = {}
+    decisions = {}
+    conflicting = set()
+    for item in request.decisions:
+        if decisions.setdefault(item.application_id, item.decision) != item.decision:
+            conflicting.add(item.application_id)
+    # Both accepted and rejected in the same batch: apply neither
+    for application_id in conflicting:
+        del decisions[application_id]
+        outcomes[application_id] = (400, "Conflicting decisions for this application")
+    
+    # Lock the applications so a concurrent accept/reject cannot change their status under us
+    result = await db.execute(
+        select(
+            ApplicationModel.id,
+            ApplicationModel.project_id,
+            ApplicationModel.role_id,
+            ApplicationModel.applicant_id,
+            ApplicationModel.status
+        )
+        .where(ApplicationModel.id.in_(decisions))
+        .order_by(ApplicationModel.id)
+        .with_for_update()
+    )
+    applications = {row.id: row for row in result}
+    
+    # Check authorization once per project
+    project_ids = {application.project_id for application in applications.values()}
+    result = await db.execute(
+        select(ProjectModel).where(ProjectModel.id.in_(project_ids))
+    )
+    projects = {project.id: project for project in result.scalars()}
+    authorized = {project_id for project_id, project in projects.items() if project.creator_id == current_user.id}
+    if authorized != project_ids:
+        result = await db.execute(
+            select(ProjectMemberModel.project_id).where(
+                and_(
+                    ProjectMemberModel.project_id.in_(project_ids - authorized),
+                    ProjectMemberModel.user_id == current_user.id,
+                    ProjectMemberModel.member_role.in_([MemberRoleEnum.ADMIN, MemberRoleEnum.PARENT])
+                )
+            )
+        )
+        authorized.update(result.scalars().all())
+    
+    rejects, accepts = [], []
+    for application_id, decision in decisions.items():
+        application = applications.get(application_id)
+        if not application:
+            outcomes[application_id] = (404, "Application not found")
+        elif application.project_id not in authorized:
+            outcomes[application_id] = (403, "Not authorized")
+        elif application.status != ApplicationStatusEnum.PENDING:
+            outcomes[application_id] = (400, "Application already processed")
+        elif decision == "reject":
+            rejects.append(application)
+        else:
+            accepts.append(application)
+    
+    # An applicant joins a project once, even if accepted for two of its roles
+    if accepts:
+        result = await db.execute(
+            select(ProjectMemberModel.project_id, ProjectMemberModel.user_id).where(
+                tuple_(ProjectMemberModel.project_id, ProjectMemberModel.user_id).in_(
+                    [(application.project_id, application.applicant_id) for application in accepts]
+                )
+            )
+        )
+        joined = set(result.tuples().all())
+        candidates, accepts = accepts, []
+        for application in candidates:
+            membership = (application.project_id, application.applicant_id)
+            if membership in joined:
+                outcomes[application.id] = (400, "Applicant is already a project member")
+            else:
+                joined.add(membership)
+                accepts.append(application)
+    
+    # Hand out the free slots of each role in request order; the role rows stay
+    # locked until commit, so the counts cannot move between this read and the UPDATE.
+    # Roles are locked before projects, in the same order as a single accept
+    granted = {}
+    if accepts:
+        result = await db.execute(
+            select(ProjectRoleModel)
+            .where(ProjectRoleModel.id.in_({application.role_id for application in accepts}))
+            .order_by(ProjectRoleModel.id)
+            .with_for_update()
+        )
+        free = {role.id: role.slots_available - role.slots_filled for role in result.scalars()}
+        candidates, accepts = accepts, []
+        for application in candidates:
+            if granted.get(application.role_id, 0) < free.get(application.role_id, 0):
+                granted[application.role_id] = granted.get(application.role_id, 0) + 1
+                accepts.append(application)
+            else:
+                outcomes[application.id] = (400, "No slots available")
+    
+    reviewed_at = datetime.now(timezone.utc)
+    if rejects:
+        await db.execute(
+            update(ApplicationModel)
+            .where(ApplicationModel.id.in_([application.id for application in rejects]))
+            .values(status=ApplicationStatusEnum.REJECTED, reviewed_at=reviewed_at)
+        )
+    
+    roles = []
+    if accepts:
+        await db.execute(
+            update(ApplicationModel)
+            .where(ApplicationModel.id.in_([application.id for application in accepts]))
+            .values(status=ApplicationStatusEnum.ACCEPTED, reviewed_at=reviewed_at)
+        )
+        
+        grants = values(
+            column("role_id", ProjectRoleModel.id.type), column("granted", Integer), name="grants"
+        ).data(list(granted.items()))
+        result = await db.execute(
+            update(ProjectRoleModel)
+            .where(ProjectRoleModel.id == grants.c.role_id)
+            .values(
+                slots_filled=ProjectRoleModel.slots_filled + grants.c.granted,
+                is_filled=ProjectRoleModel.slots_filled + grants.c.granted >= ProjectRoleModel.slots_available
+            )
+            .returning(ProjectRoleModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        roles = result.scalars().all()
+        
+        await db.execute(
+            insert(ProjectMemberModel),
+            [
+                {
+                    "project_id": application.project_id,
+                    "user_id": application.applicant_id,
+                    "role_id": application.role_id,
+                    "member_role": MemberRoleEnum.CHILD
+                }
+                for application in accepts
+            ]
+        )
+    
+    # One counter UPDATE per touched project, in id order like the row locks above
+    accepted_by_project = Counter(application.project_id for application in accepts)
+    rejected_by_project = Counter(application.project_id for application in rejects)
+    for project_id in sorted(accepted_by_project.keys() | rejected_by_project.keys()):
+        accepted = accepted_by_project[project_id]
+        statement = counter_update(
+            project_id,
+            pending_applications=-(accepted + rejected_by_project[project_id]),
+            member_count=accepted,
+            open_slots=-accepted
+        )
+        await db.execute(statement)
+        if not accepted:
+            continue
+        result = await db.execute(staffing_update(project_id))
+        set_committed_value(projects[project_id], "is_fully_staffed", result.scalar_one())
+    
+    await db.commit()
+    
+    for role in roles:
+        search_indexes.role_slots_changed(projects[role.project_id], role, -granted[role.id])
+    for application in accepts:
+        search_indexes.member_joined(projects[application.project_id], application.applicant_id)
+    
+    for application in accepts:
+        outcomes[application.id] = (200, "Application accepted")
+    for application in rejects:
+        outcomes[application.id] = (200, "Application rejected")
+    
+    # Repeats of the same decision share its outcome
+    return [
+        ReviewResult(
+            application_id=str(item.application_id),
+            decision=item.decision,
+            status_code=outcomes[item.application_id][0],
+            detail=outcomes[item.application_id][1]
+        )
+        for item in request.decisions
+    ]
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
+from sqlalchemy.orm.attributes import set_committed_value
 from database.initialization import get_db
 from database.schemas import (
-    ProjectModel, ProjectMemberModel, ProjectStatusEnum, MemberRoleEnum
+    ProjectModel, ProjectMemberModel, ProjectRoleModel, ProjectStatusEnum, MemberRoleEnum
 )
 from utils.auth import get_current_user
+from utils import search_indexes
+from utils.project_counters import counter_update
 from pydantic import BaseModel
 from uuid import UUID
 from datetime import datetime, timezone
@@ -49,11 +52,31 @@ async def update_project_status(
         raise HTTPException(403, "Only parents and admins can update status")
     
     # Update status
+    was_active = project.status == ProjectStatusEnum.ACTIVE
+    is_active = request.status == ProjectStatusEnum.ACTIVE
     project.status = request.status
     project.last_status_update = datetime.now(timezone.utc)
     
+    # Open roles and members move in or out of the search and candidate indexes
+    open_roles = []
+    if was_active != is_active:
+        result = await db.execute(
+            select(ProjectRoleModel).where(
+                ProjectRoleModel.project_id == project_id,
+                ProjectRoleModel.is_filled == False
+            )
+        )
+        open_roles = result.scalars().all()
+        result = await db.execute(
+            select(ProjectMemberModel.user_id).where(ProjectMemberModel.project_id == project_id)
+        )
+        member_user_ids = result.scalars().all()
+    
     await db.commit()
     
+    if was_active != is_active:
+        search_indexes.project_activity_changed(project, is_active, open_roles, member_user_ids)
+    
     return {"message": f"Project status updated to {request.status.value}"}
 
 @router.put("/project/{project_id}/member/{user_id}/promote")
@@ -184,18 +207,36 @@ async def remove_member(
     if member.member_role == MemberRoleEnum.ADMIN:
         raise HTTPException(400, "Cannot remove admin")
     
-    # Remove member and update role slots if they had a role
+    # Role before project, in the same lock order as accepting an application;
+    # the project row is only locked by the counter UPDATE below
+    result = await db.execute(select(ProjectModel).where(ProjectModel.id == project_id))
+    project = result.scalar_one()
+    
+    # Free the member's slot in SQL so a concurrent accept's increment is never overwritten
+    role = None
     if member.role_id:
-        from database.schemas import ProjectRoleModel
         result = await db.execute(
-            select(ProjectRoleModel).where(ProjectRoleModel.id == member.role_id)
+            update(ProjectRoleModel)
+            .where(ProjectRoleModel.id == member.role_id, ProjectRoleModel.slots_filled > 0)
+            .values(slots_filled=ProjectRoleModel.slots_filled - 1, is_filled=False)
+            .returning(ProjectRoleModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
         role = result.scalar_one_or_none()
-        if role:
-            role.slots_filled -= 1
-            role.is_filled = False
     
     await db.delete(member)
+    if role:
+        # The freed slot reopens the role, so the project is no longer fully staffed
+        await db.execute(
+            counter_update(project_id, member_count=-1, open_slots=1).values(is_fully_staffed=False)
+        )
+        set_committed_value(project, "is_fully_staffed", False)
+    else:
+        await db.execute(counter_update(project_id, member_count=-1))
     await db.commit()
     
+    if role:
+        search_indexes.role_slots_changed(project, role, 1)
+    search_indexes.member_left(project, user_id)
+    
     return {"message": "Member removed"}
\ No newline at end of file
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 from database.initialization import get_db
 from database.schemas import UserProfileModel, SkillModel, user_skills
 from utils.auth import get_current_user
+from utils import search_indexes
+from utils.etag import make_etag, etag_matches, not_modified
 from utils.validators import CreateProfileRequest
 from pydantic import BaseModel
 from database.schemas import GenderEnum
@@ -121,6 +123,8 @@ async def create_profile(
     await db.commit()
     await db.refresh(profile)
     
+    search_indexes.profile_saved(profile, None, [], request.skill_ids)
+    
     # Get skills with all data in one query (already fetched above, reuse)
     if request.skill_ids:
         result = await db.execute(
@@ -153,9 +157,24 @@ async def create_profile(
     )
 @router.get("/me", response_model=ProfileResponse)
 async def get_my_profile(
+    if_none_match: str | None = Header(None),
+    response: Response = None,
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    """Own profile with skills; ETag from updated_at, a matching If-None-Match gets a 304."""
+    
+    if if_none_match:
+        result = await db.execute(
+            select(UserProfileModel.id, UserProfileModel.updated_at)
+            .where(UserProfileModel.user_id == current_user.id)
+        )
+        row = result.one_or_none()
+        if row:
+            etag = make_etag(row.id, row.updated_at.isoformat())
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+    
     result = await db.execute(
         select(UserProfileModel)
         .options(selectinload(UserProfileModel.skills))
@@ -169,6 +188,7 @@ async def get_my_profile(
     # Use the relationship - no extra query needed
     skills = [{"id": s.id, "name": s.name, "category": s.category} for s in profile.skills]
     
+    response.headers["ETag"] = make_etag(profile.id, profile.updated_at.isoformat())
     return ProfileResponse(
         id=str(profile.id),
         user_id=str(profile.user_id),
@@ -215,6 +235,7 @@ async def update_profile(
             raise HTTPException(400, f"Invalid skill IDs: {invalid_skills}")
     
     # Update fields
+    old_profession = profile.profession
     profile.name = request.name
     profile.age = request.age
     profile.gender = request.gender
@@ -230,11 +251,17 @@ async def update_profile(
     profile.years_of_experience = request.years_of_experience
     profile.previous_projects = request.previous_projects
     profile.portfolio_url = request.portfolio_url
+    # Skills live in user_skills; bump updated_at so the profile ETag changes with them
+    profile.updated_at = func.now()
     
     # Update skills - FIXED: use user_profile_id and profile.id
-    await db.execute(
-        user_skills.delete().where(user_skills.c.user_profile_id == profile.id)
+    # RETURNING hands back the previous skills for the search indexes
+    result = await db.execute(
+        user_skills.delete()
+        .where(user_skills.c.user_profile_id == profile.id)
+        .returning(user_skills.c.skill_id)
     )
+    old_skill_ids = result.scalars().all()
     
     # Bulk insert skills
     if request.skill_ids:
@@ -246,6 +273,8 @@ async def update_profile(
     await db.commit()
     await db.refresh(profile)
     
+    search_indexes.profile_saved(profile, old_profession, old_skill_ids, request.skill_ids)
+    
     # Get skills - optimized fetch
     if request.skill_ids:
         result = await db.execute(
@@ -1,16 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, exists
+from sqlalchemy.orm import selectinload
 from database.initialization import get_db
 from database.schemas import (
-    ProjectModel, ProjectRoleModel, ProjectMemberModel, 
+    ProjectModel, ProjectRoleModel, ProjectMemberModel, ApplicationModel,
     ProjectTypeEnum, ProjectStatusEnum, PaymentTypeEnum, MemberRoleEnum,
-    UserProfileModel
+    UserProfileModel, SkillModel
 )
-from utils.auth import get_current_user
-from pydantic import BaseModel, Field
+from utils.auth import get_current_user, get_optional_user
+from utils import search_indexes
+from utils.etag import make_etag, etag_matches, not_modified
+from utils.pagination import keyset_page, split_page, NEXT_CURSOR_HEADER
+from config import IMPORT_CHUNK_SIZE
+from pydantic import BaseModel, Field, ValidationError
+from typing import Literal
 from datetime import datetime, timezone
 from uuid import UUID
+import csv
+import json
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -46,6 +54,10 @@ class ProjectResponse(BaseModel):
     estimated_completion: str | None
     status: str
     is_fully_staffed: bool
+    member_count: int
+    open_slots: int
+    # Creator views only: it moves with every application, so cached public reads leave it out
+    pending_applications: int | None = None
     city: str | None
     state: str | None
     country: str | None
@@ -54,6 +66,43 @@ class ProjectResponse(BaseModel):
     created_at: str
     roles: list[dict] = []
 
+def role_data(role) -> dict:
+    return {
+        "id": str(role.id),
+        "skill_id": role.skill_id,
+        "role_title": role.role_title,
+        "description": role.description,
+        "slots_available": role.slots_available,
+        "slots_filled": role.slots_filled,
+        "is_filled": role.is_filled,
+        "payment_type": role.payment_type.value,
+        "payment_amount": role.payment_amount,
+        "payment_details": role.payment_details
+    }
+
+def project_response(project, roles, include_pending: bool = False) -> ProjectResponse:
+    return ProjectResponse(
+        id=str(project.id),
+        creator_id=str(project.creator_id),
+        name=project.name,
+        description=project.description,
+        project_type=project.project_type.value,
+        release_platform=project.release_platform,
+        estimated_completion=project.estimated_completion.isoformat() if project.estimated_completion else None,
+        status=project.status.value,
+        is_fully_staffed=project.is_fully_staffed,
+        member_count=project.member_count,
+        open_slots=project.open_slots,
+        pending_applications=project.pending_applications if include_pending else None,
+        city=project.city,
+        state=project.state,
+        country=project.country,
+        latitude=project.latitude,
+        longitude=project.longitude,
+        created_at=project.created_at.isoformat(),
+        roles=[role_data(role) for role in roles]
+    )
+
 @router.post("/create", status_code=status.HTTP_201_CREATED, response_model=ProjectResponse)
 async def create_project(
     request: CreateProjectRequest,
@@ -80,14 +129,16 @@ async def create_project(
         country=request.country,
         latitude=request.latitude,
         longitude=request.longitude,
-        last_status_update=datetime.now(timezone.utc)
+        last_status_update=datetime.now(timezone.utc),
+        member_count=1,
+        open_slots=sum(role_req.slots_available for role_req in request.roles)
     )
     
     db.add(project)
     await db.flush()
     
     # Add roles
-    roles_data = []
+    roles = []
     for role_req in request.roles:
         role = ProjectRoleModel(
             project_id=project.id,
@@ -101,18 +152,7 @@ async def create_project(
         )
         db.add(role)
         await db.flush()
-        roles_data.append({
-            "id": str(role.id),
-            "skill_id": role.skill_id,
-            "role_title": role.role_title,
-            "description": role.description,
-            "slots_available": role.slots_available,
-            "slots_filled": role.slots_filled,
-            "is_filled": role.is_filled,
-            "payment_type": role.payment_type.value,
-            "payment_amount": role.payment_amount,
-            "payment_details": role.payment_details
-        })
+        roles.append(role)
     
     # Add creator as ADMIN member
     member = ProjectMemberModel(
@@ -125,74 +165,183 @@ async def create_project(
     await db.commit()
     await db.refresh(project)
     
-    return ProjectResponse(
-        id=str(project.id),
-        creator_id=str(project.creator_id),
-        name=project.name,
-        description=project.description,
-        project_type=project.project_type.value,
-        release_platform=project.release_platform,
-        estimated_completion=project.estimated_completion.isoformat() if project.estimated_completion else None,
-        status=project.status.value,
-        is_fully_staffed=project.is_fully_staffed,
-        city=project.city,
-        state=project.state,
-        country=project.country,
-        latitude=project.latitude,
-        longitude=project.longitude,
-        created_at=project.created_at.isoformat(),
-        roles=roles_data
+    search_indexes.project_created(project, roles)
+    
+    return project_response(project, roles)
+
+async def body_lines(request: Request):
+    """Yield (line_number, raw bytes) for each non-blank line of the request body as it arrives"""
+    buffer = b""
+    line_number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+    if buffer.strip():
+        yield line_number + 1, buffer
+
+async def import_records(request: Request, fmt: str):
+    """
+    Yield (line_number, CreateProjectRequest or error message). NDJSON lines are project
+    objects; CSV rows carry the project columns plus a JSON `roles` column.
+    """
+    header = None
+    async for line_number, raw in body_lines(request):
+        try:
+            # Decoded per line so one bad byte only fails its own row
+            line = raw.decode("utf-8-sig" if line_number == 1 else "utf-8")
+            if fmt == "ndjson":
+                yield line_number, CreateProjectRequest.model_validate_json(line)
+                continue
+            values = next(csv.reader([line]))
+            if header is None:
+                header = values
+                continue
+            row = {key: value for key, value in zip(header, values) if value != ""}
+            row["roles"] = json.loads(row.get("roles", "[]"))
+            yield line_number, CreateProjectRequest.model_validate(row)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            yield line_number, f"{location}: {error['msg']}" if location else error["msg"]
+        except UnicodeDecodeError:
+            yield line_number, "Line is not valid UTF-8"
+        except ValueError as e:
+            yield line_number, f"Malformed row: {e}"
+
+async def insert_project_chunk(db, chunk, creator_id):
+    """Multi-row inserts for a chunk of validated projects, their roles and admin memberships"""
+    now = datetime.now(timezone.utc)
+    result = await db.execute(
+        insert(ProjectModel).returning(ProjectModel, sort_by_parameter_order=True),
+        [
+            {
+                **project.model_dump(exclude={"roles"}),
+                "creator_id": creator_id,
+                "last_status_update": now,
+                "member_count": 1,
+                "open_slots": sum(role.slots_available for role in project.roles)
+            }
+            for _, project in chunk
+        ]
+    )
+    projects = result.scalars().all()
+    
+    role_rows = [
+        {**role.model_dump(), "project_id": project.id}
+        for project, (_, request) in zip(projects, chunk)
+        for role in request.roles
+    ]
+    roles = []
+    if role_rows:
+        result = await db.execute(
+            insert(ProjectRoleModel).returning(ProjectRoleModel, sort_by_parameter_order=True),
+            role_rows
+        )
+        roles = result.scalars().all()
+    
+    await db.execute(
+        insert(ProjectMemberModel),
+        [
+            {"project_id": project.id, "user_id": creator_id, "member_role": MemberRoleEnum.ADMIN}
+            for project in projects
+        ]
+    )
+    
+    roles_by_project = {}
+    for role in roles:
+        roles_by_project.setdefault(role.project_id, []).append(role)
+    return [(project, roles_by_project.get(project.id, [])) for project in projects]
+
+@router.post("/import")
+async def import_projects(
+    request: Request,
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Bulk-create projects owned by the current user from an NDJSON or CSV body
+    (Content-Type application/x-ndjson or text/csv). Rows are validated as they stream
+    in and written IMPORT_CHUNK_SIZE at a time, one transaction per chunk; invalid rows
+    are reported by line and never block the rest.
+    """
+    
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type:
+        fmt = "ndjson"
+    elif "csv" in content_type:
+        fmt = "csv"
+    else:
+        raise HTTPException(415, "Send application/x-ndjson or text/csv")
+    
+    # Check if user has profile
+    result = await db.execute(
+        select(UserProfileModel.id).where(UserProfileModel.user_id == current_user.id)
     )
+    if not result.scalar_one_or_none():
+        raise HTTPException(400, "Create profile first")
+    
+    result = await db.execute(select(SkillModel.id))
+    skill_ids = set(result.scalars().all())
+    
+    # A failed chunk's rollback expires current_user (same session), so keep the id
+    creator_id = current_user.id
+    created = []
+    errors = []
+    
+    async def flush(chunk):
+        try:
+            saved = await insert_project_chunk(db, chunk, creator_id)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"❌ Import chunk at line {chunk[0][0]} failed: {e}")
+            errors.extend({"line": line, "error": "Chunk failed to save"} for line, _ in chunk)
+            return
+        search_indexes.projects_imported(saved)
+        for (line, _), (project, _) in zip(chunk, saved):
+            created.append({"line": line, "id": str(project.id)})
+    
+    chunk = []
+    async for line, record in import_records(request, fmt):
+        if isinstance(record, str):
+            errors.append({"line": line, "error": record})
+            continue
+        unknown_skills = {role.skill_id for role in record.roles} - skill_ids
+        if unknown_skills:
+            errors.append({"line": line, "error": f"Invalid skill IDs: {unknown_skills}"})
+            continue
+        chunk.append((line, record))
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            await flush(chunk)
+            chunk = []
+    if chunk:
+        await flush(chunk)
+    
+    return {
+        "imported": len(created),
+        "failed": len(errors),
+        "created": created,
+        "errors": errors
+    }
 
 @router.get("/my/projects", response_model=list[ProjectResponse])
 async def get_my_projects(
     current_user = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
+    # Roles for every project come in one selectin batch
     result = await db.execute(
-        select(ProjectModel).where(ProjectModel.creator_id == current_user.id)
+        select(ProjectModel)
+        .options(selectinload(ProjectModel.roles))
+        .where(ProjectModel.creator_id == current_user.id)
     )
     projects = result.scalars().all()
     
-    response = []
-    for project in projects:
-        result = await db.execute(
-            select(ProjectRoleModel).where(ProjectRoleModel.project_id == project.id)
-        )
-        roles = result.scalars().all()
-        roles_data = [{
-            "id": str(r.id),
-            "skill_id": r.skill_id,
-            "role_title": r.role_title,
-            "description": r.description,
-            "slots_available": r.slots_available,
-            "slots_filled": r.slots_filled,
-            "is_filled": r.is_filled,
-            "payment_type": r.payment_type.value,
-            "payment_amount": r.payment_amount,
-            "payment_details": r.payment_details
-        } for r in roles]
-        
-        response.append(ProjectResponse(
-            id=str(project.id),
-            creator_id=str(project.creator_id),
-            name=project.name,
-            description=project.description,
-            project_type=project.project_type.value,
-            release_platform=project.release_platform,
-            estimated_completion=project.estimated_completion.isoformat() if project.estimated_completion else None,
-            status=project.status.value,
-            is_fully_staffed=project.is_fully_staffed,
-            city=project.city,
-            state=project.state,
-            country=project.country,
-            latitude=project.latitude,
-            longitude=project.longitude,
-            created_at=project.created_at.isoformat(),
-            roles=roles_data
-        ))
-    
-    return response
+    return [project_response(project, project.roles, include_pending=True) for project in projects]
 
 # FIXED: Changed from /working to /my/working to avoid route conflict with /{project_id}
 @router.get("/my/working")
@@ -205,52 +354,22 @@ async def get_working_projects(
     (excluding projects they created)
     """
 
-    # Get memberships where user is a CHILD (accepted member)
+    # Memberships where user is a CHILD (accepted member), with project, role and
+    # creator profile in one statement; team size is the project's member_count
     result = await db.execute(
-        select(ProjectMemberModel)
+        select(ProjectModel, ProjectRoleModel.role_title, UserProfileModel.name)
+        .join(ProjectMemberModel, ProjectMemberModel.project_id == ProjectModel.id)
+        .outerjoin(ProjectRoleModel, ProjectRoleModel.id == ProjectMemberModel.role_id)
+        .outerjoin(UserProfileModel, UserProfileModel.user_id == ProjectModel.creator_id)
         .where(
             ProjectMemberModel.user_id == current_user.id,
-            ProjectMemberModel.member_role == MemberRoleEnum.CHILD
+            ProjectMemberModel.member_role == MemberRoleEnum.CHILD,
+            ProjectModel.creator_id != current_user.id
         )
     )
-    memberships = result.scalars().all()
-
-    projects_response = []
-
-    for member in memberships:
-        # Get project
-        result = await db.execute(
-            select(ProjectModel).where(ProjectModel.id == member.project_id)
-        )
-        project = result.scalar_one_or_none()
-
-        if not project or project.creator_id == current_user.id:
-            continue
-
-        # Get role user is working as
-        role = None
-        if member.role_id:
-            role_result = await db.execute(
-                select(ProjectRoleModel).where(ProjectRoleModel.id == member.role_id)
-            )
-            role = role_result.scalar_one_or_none()
 
-        # Get creator profile
-        profile_result = await db.execute(
-            select(UserProfileModel).where(
-                UserProfileModel.user_id == project.creator_id
-            )
-        )
-        creator_profile = profile_result.scalar_one_or_none()
-
-        # Team size
-        team_result = await db.execute(
-            select(ProjectMemberModel)
-            .where(ProjectMemberModel.project_id == project.id)
-        )
-        team_size = len(team_result.scalars().all())
-
-        projects_response.append({
+    projects_response = [
+        {
             "id": str(project.id),
             "project_name": project.name,
             "name": project.name,
@@ -264,61 +383,193 @@ async def get_working_projects(
             "city": project.city,
             "state": project.state,
             "country": project.country,
-            "my_role": role.role_title if role else None,
-            "creator_name": creator_profile.name if creator_profile else "Unknown",
-            "team_size": team_size
-        })
+            "my_role": role_title,
+            "creator_name": creator_name or "Unknown",
+            "team_size": project.member_count
+        }
+        for project, role_title, creator_name in result.all()
+    ]
 
     return {
         "projects": projects_response
     }
 
+@router.get("/browse", response_model=list[ProjectResponse])
+async def browse_projects(
+    sort: Literal["newest", "updated"] = Query("newest"),
+    project_type: ProjectTypeEnum | None = Query(None),
+    payment_type: PaymentTypeEnum | None = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    response: Response = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Visible projects, newest first (sort=newest) or by latest status update
+    (sort=updated). payment_type keeps projects with an open role paying that way.
+    The next page's cursor is in X-Next-Cursor.
+    """
+    
+    query = (
+        select(ProjectModel)
+        .options(selectinload(ProjectModel.roles))
+        .where(
+            ProjectModel.status == ProjectStatusEnum.ACTIVE,
+            ProjectModel.is_fully_staffed == False
+        )
+    )
+    
+    if project_type:
+        query = query.where(ProjectModel.project_type == project_type)
+    
+    if payment_type:
+        query = query.where(
+            exists().where(
+                ProjectRoleModel.project_id == ProjectModel.id,
+                ProjectRoleModel.payment_type == payment_type,
+                ProjectRoleModel.is_filled == False
+            )
+        )
+    
+    if sort == "updated":
+        sort_keys = [ProjectModel.last_status_update, ProjectModel.id]
+        query = query.where(ProjectModel.last_status_update.isnot(None))
+    else:
+        sort_keys = [ProjectModel.created_at, ProjectModel.id]
+    
+    # Descending (sort key, id) keyset, served by the idx_project_browse_* indexes
+    result = await db.execute(keyset_page(query, sort_keys, cursor, limit, descending=True))
+    rows, next_cursor = split_page(result.all(), limit, len(sort_keys))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return [project_response(project, project.roles) for project, *_ in rows]
+
+DETAIL_SECTIONS = {"roles", "members", "creator", "application"}
+
+@router.get("/{project_id}/detail")
+async def get_project_detail(
+    project_id: UUID,
+    include: str | None = Query(None),
+    current_user = Depends(get_optional_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Project page in one call: project, roles, members with names, creator profile and
+    the caller's applications. include=roles,members,... picks sections (default all);
+    at most four queries regardless of team or role count.
+    Members are only listed to members of the project.
+    """
+    
+    sections = DETAIL_SECTIONS if include is None else {s.strip() for s in include.split(",") if s.strip()}
+    unknown = sections - DETAIL_SECTIONS
+    if unknown:
+        raise HTTPException(400, f"Unknown include section: {', '.join(sorted(unknown))}")
+    
+    # Get project with its creator's profile
+    query = (
+        select(ProjectModel, UserProfileModel)
+        .outerjoin(UserProfileModel, UserProfileModel.user_id == ProjectModel.creator_id)
+        .where(ProjectModel.id == project_id)
+    )
+    if "roles" in sections:
+        query = query.options(selectinload(ProjectModel.roles))
+    row = (await db.execute(query)).one_or_none()
+    if not row:
+        raise HTTPException(404, "Project not found")
+    project, creator = row
+    
+    response = {
+        "project": project_response(project, project.roles if "roles" in sections else [])
+    }
+    
+    if "creator" in sections:
+        response["creator"] = {
+            "user_id": str(project.creator_id),
+            "name": creator.name if creator else "Unknown",
+            "profession": creator.profession if creator else None,
+            "city": creator.city if creator else None,
+            "country": creator.country if creator else None,
+            "profile_photo_url": creator.profile_photo_url if creator else None
+        }
+    
+    if "members" in sections:
+        result = await db.execute(
+            select(ProjectMemberModel, UserProfileModel.name)
+            .outerjoin(UserProfileModel, UserProfileModel.user_id == ProjectMemberModel.user_id)
+            .where(ProjectMemberModel.project_id == project_id)
+        )
+        members = result.all()
+        is_member = current_user is not None and any(m.user_id == current_user.id for m, _ in members)
+        response["members"] = [
+            {
+                "user_id": str(member.user_id),
+                "name": name or "Unknown",
+                "role_id": str(member.role_id) if member.role_id else None,
+                "member_role": member.member_role.value,
+                "joined_at": member.joined_at.isoformat()
+            }
+            for member, name in members
+        ] if is_member else None
+    
+    if "application" in sections:
+        applications = []
+        if current_user:
+            result = await db.execute(
+                select(ApplicationModel).where(
+                    ApplicationModel.project_id == project_id,
+                    ApplicationModel.applicant_id == current_user.id
+                )
+            )
+            applications = result.scalars().all()
+        response["my_applications"] = [
+            {
+                "id": str(app.id),
+                "role_id": str(app.role_id),
+                "status": app.status.value,
+                "applied_at": app.applied_at.isoformat()
+            }
+            for app in applications
+        ]
+    
+    return response
+
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
+    if_none_match: str | None = Header(None),
+    response: Response = None,
     db: AsyncSession = Depends(get_db)
 ):
+    """
+    Get a project with its roles. Sends an ETag from projects.updated_at plus the member
+    and open-slot counters, which move on every membership change without bumping
+    updated_at; a matching If-None-Match gets a 304 after a one-row lookup.
+    """
+    
+    if if_none_match:
+        result = await db.execute(
+            select(ProjectModel.updated_at, ProjectModel.member_count, ProjectModel.open_slots)
+            .where(ProjectModel.id == project_id)
+        )
+        version = result.one_or_none()
+        if version is not None:
+            updated_at, member_count, open_slots = version
+            etag = make_etag(project_id, updated_at.isoformat(), member_count, open_slots)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+    
     result = await db.execute(
-        select(ProjectModel).where(ProjectModel.id == project_id)
+        select(ProjectModel)
+        .options(selectinload(ProjectModel.roles))
+        .where(ProjectModel.id == project_id)
     )
     project = result.scalar_one_or_none()
     
     if not project:
         raise HTTPException(404, "Project not found")
     
-    # Get roles
-    result = await db.execute(
-        select(ProjectRoleModel).where(ProjectRoleModel.project_id == project_id)
+    response.headers["ETag"] = make_etag(
+        project.id, project.updated_at.isoformat(), project.member_count, project.open_slots
     )
-    roles = result.scalars().all()
-    roles_data = [{
-        "id": str(r.id),
-        "skill_id": r.skill_id,
-        "role_title": r.role_title,
-        "description": r.description,
-        "slots_available": r.slots_available,
-        "slots_filled": r.slots_filled,
-        "is_filled": r.is_filled,
-        "payment_type": r.payment_type.value,
-        "payment_amount": r.payment_amount,
-        "payment_details": r.payment_details
-    } for r in roles]
-    
-    return ProjectResponse(
-        id=str(project.id),
-        creator_id=str(project.creator_id),
-        name=project.name,
-        description=project.description,
-        project_type=project.project_type.value,
-        release_platform=project.release_platform,
-        estimated_completion=project.estimated_completion.isoformat() if project.estimated_completion else None,
-        status=project.status.value,
-        is_fully_staffed=project.is_fully_staffed,
-        city=project.city,
-        state=project.state,
-        country=project.country,
-        latitude=project.latitude,
-        longitude=project.longitude,
-        created_at=project.created_at.isoformat(),
-        roles=roles_data
-    )
\ No newline at end of file
+    return project_response(project, project.roles)
@@ -1,25 +1,90 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
-from database.initialization import get_db
+from sqlalchemy import select, and_, or_, case, extract, func, exists, null, literal, any_, union_all, Float
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import selectinload
+from database.initialization import get_db, AsyncSessionLocal
 from database.schemas import (
-    ProjectModel, ProjectRoleModel, UserProfileModel, SkillModel,
-    ProjectStatusEnum, user_skills
+    ProjectModel, ProjectRoleModel, UserProfileModel,
+    ProjectStatusEnum, ProjectTypeEnum, PaymentTypeEnum, user_skills
 )
+from utils.geo_index import GeoIndex, project_locations, profile_locations, bounding_box
+from utils.suggestions import search_suggestions, MAX_SUGGESTIONS
+from utils.skill_facets import skill_facets
+from utils.skill_index import crew_skills
+from utils.pagination import keyset_page, split_page, encode_cursor, decode_cursor, NEXT_CURSOR_HEADER
+from utils.search_cache import project_search_cache
+from utils.relevance import project_relevance
+from utils.project_feed import project_feed
+from utils.auth import get_current_user, get_optional_user, optional_security
+from config import SEARCH_STREAM_BATCH_SIZE, SEARCH_MAX_SKILL_IDS
 from pydantic import BaseModel
-from math import radians, cos, sin, asin, sqrt
+from typing import Literal
+from math import radians, cos
+import numpy as np
+import time
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
-def haversine(lon1, lat1, lon2, lat2):
-    """Calculate distance between two points in km"""
-    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    km = 6371 * c
-    return km
+# Rows without coordinates sort after every real distance
+NO_DISTANCE = float("inf")
+
+NDJSON = "application/x-ndjson"
+
+def distance_km(lat_column, lon_column, latitude, longitude):
+    """SQL expression for the haversine distance in km from a fixed point"""
+    dlat = func.radians(lat_column - latitude) / 2
+    dlon = func.radians(lon_column - longitude) / 2
+    a = (
+        func.power(func.sin(dlat), 2)
+        + cos(radians(latitude)) * func.cos(func.radians(lat_column)) * func.power(func.sin(dlon), 2)
+    )
+    # least() guards asin against rounding just above 1.0
+    return 6371 * 2 * func.asin(func.least(1.0, func.sqrt(a)))
+
+def within_bounding_box(model, latitude, longitude, radius_km):
+    """Index-friendly lat/lon range predicate that encloses the search radius"""
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    if min_lon <= max_lon:
+        lon_filter = model.longitude.between(min_lon, max_lon)
+    else:
+        # Box wraps around the antimeridian
+        lon_filter = or_(model.longitude >= min_lon, model.longitude <= max_lon)
+    return and_(model.latitude.between(min_lat, max_lat), lon_filter)
+
+def with_distance(query, model, index: GeoIndex, latitude, longitude, max_distance_km):
+    """
+    Add a distance_km column and radius filter to a search query. Returns the query and
+    a non-null distance sort key (None without coordinates).
+    A radius keeps only candidate ids: the geo index's hits once it is loaded, otherwise
+    a SQL haversine check, plus a UNION ALL branch for rows without coordinates.
+    Postgres then reads just those rows instead of scanning every visible one.
+    """
+    if not (latitude and longitude):
+        return query.add_columns(null().label("distance_km")), None
+    
+    distance = distance_km(model.latitude, model.longitude, latitude, longitude)
+    if max_distance_km:
+        # The box lets Postgres use the (latitude, longitude) index and haversine only
+        # re-checks the corners. Index hits are re-checked too, since another worker
+        # may have moved the row since this worker's copy was loaded
+        in_radius = and_(
+            within_bounding_box(model, latitude, longitude, max_distance_km),
+            distance <= max_distance_km
+        )
+        if index.loaded:
+            keys, _ = index.query(latitude, longitude, max_distance_km)
+            in_radius = and_(model.id == any_(literal(keys, ARRAY(UUID(as_uuid=True)))), in_radius)
+        # Rows without coordinates are still listed, as before, from their own branch
+        # (served by the idx_*_no_location partial indexes) so the box stays sargable
+        candidates = union_all(
+            select(model.id).where(in_radius).correlate(None),
+            select(model.id).where(or_(model.latitude.is_(None), model.longitude.is_(None))).correlate(None)
+        )
+        query = query.where(model.id.in_(candidates))
+    
+    return query.add_columns(distance.label("distance_km")), func.coalesce(distance, NO_DISTANCE)
 
 class ProjectSearchResult(BaseModel):
     id: str
@@ -44,48 +109,52 @@ class UserSearchResult(BaseModel):
     profile_photo_url: str | None
     skills: list[dict]
 
-@router.get("/projects", response_model=list[ProjectSearchResult])
-async def search_projects(
-    skill_id: int | None = Query(None),
-    project_type: str | None = Query(None),
-    latitude: float | None = Query(None),
-    longitude: float | None = Query(None),
-    max_distance_km: float | None = Query(None),
-    db: AsyncSession = Depends(get_db)
-):
-    """Search for projects. Filter by skill, type, and location."""
-    
-    query = select(ProjectModel).where(
+# One statement for the projects, one selectin batch for their open roles
+OPEN_ROLES = selectinload(ProjectModel.roles.and_(ProjectRoleModel.is_filled == False))
+
+class FeedItem(ProjectSearchResult):
+    matching_roles: int
+
+def project_search_query(skill_id, project_type, latitude, longitude, max_distance_km, columns=None):
+    """
+    Visible projects matching the filters, with open roles eager-loaded; returns (query, distance_key).
+    columns selects plain columns instead of the project entity.
+    """
+    query = select(*columns) if columns else select(ProjectModel).options(OPEN_ROLES)
+    query = query.where(
         and_(
             ProjectModel.status == ProjectStatusEnum.ACTIVE,
             ProjectModel.is_fully_staffed == False
         )
     )
     
-    result = await db.execute(query)
-    projects = result.scalars().all()
-    
-    results = []
-    for project in projects:
-        result = await db.execute(
-            select(ProjectRoleModel).where(ProjectRoleModel.project_id == project.id)
+    if skill_id:
+        query = query.where(
+            exists().where(
+                ProjectRoleModel.project_id == ProjectModel.id,
+                ProjectRoleModel.skill_id == skill_id,
+                ProjectRoleModel.is_filled == False
+            )
         )
-        roles = result.scalars().all()
-        
-        if skill_id:
-            if not any(r.skill_id == skill_id and not r.is_filled for r in roles):
-                continue
-        
-        if project_type and project.project_type.value != project_type:
-            continue
-        
-        distance = None
-        if latitude and longitude and project.latitude and project.longitude:
-            distance = haversine(longitude, latitude, project.longitude, project.latitude)
-            if max_distance_km and distance > max_distance_km:
-                continue
-        
-        roles_data = [{
+    
+    if project_type:
+        query = query.where(ProjectModel.project_type == project_type)
+    
+    return with_distance(
+        query, ProjectModel, project_locations, latitude, longitude, max_distance_km
+    )
+
+def project_search_result(project, distance) -> ProjectSearchResult:
+    return ProjectSearchResult(
+        id=str(project.id),
+        name=project.name,
+        description=project.description,
+        project_type=project.project_type.value,
+        city=project.city,
+        state=project.state,
+        country=project.country,
+        distance_km=round(distance, 2) if distance else None,
+        roles=[{
             "id": str(r.id),
             "skill_id": r.skill_id,
             "role_title": r.role_title,
@@ -94,85 +163,381 @@ async def search_projects(
             "is_filled": r.is_filled,
             "payment_type": r.payment_type.value,
             "payment_amount": r.payment_amount
-        } for r in roles if not r.is_filled]
-        
-        results.append(ProjectSearchResult(
-            id=str(project.id),
-            name=project.name,
-            description=project.description,
-            project_type=project.project_type.value,
-            city=project.city,
-            state=project.state,
-            country=project.country,
-            distance_km=round(distance, 2) if distance else None,
-            roles=roles_data
+        } for r in project.roles]
+    )
+
+def wants_ndjson(accept: str | None) -> bool:
+    return bool(accept) and NDJSON in accept
+
+def stream_ndjson(query, to_result) -> StreamingResponse:
+    """
+    Stream one JSON result per line straight off a server-side cursor. Rows come in
+    batches of SEARCH_STREAM_BATCH_SIZE (eager loads run per batch) and are unordered,
+    so neither the first byte nor memory waits on the full result.
+    """
+    async def lines():
+        # Own session: the request's one is closed once the endpoint returns
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(query.execution_options(yield_per=SEARCH_STREAM_BATCH_SIZE))
+            async for entity, distance in result:
+                yield to_result(entity, distance).model_dump_json() + "\n"
+    
+    return StreamingResponse(lines(), media_type=NDJSON)
+
+async def relevance_page(db, filters: tuple, user, cursor, limit, response):
+    """
+    Rank every candidate project with one NumPy pass over its open roles, then load
+    only the requested page. Pages continue from a (clock, -score, id) cursor.
+    """
+    user_skill_ids = []
+    if user:
+        result = await db.execute(
+            select(user_skills.c.skill_id)
+            .join(UserProfileModel, UserProfileModel.id == user_skills.c.user_profile_id)
+            .where(UserProfileModel.user_id == user.id)
+        )
+        user_skill_ids = result.scalars().all()
+    
+    # Candidate features straight from SQL: one row per open role, as plain numbers
+    payment_score = case(
+        (ProjectRoleModel.payment_type == PaymentTypeEnum.PAID, 1.0),
+        (ProjectRoleModel.payment_type == PaymentTypeEnum.NEGOTIABLE, 0.5),
+        else_=0.0
+    )
+    query, _ = project_search_query(*filters, columns=(
+        ProjectModel.id,
+        extract("epoch", func.coalesce(ProjectModel.last_status_update, ProjectModel.created_at))
+    ))
+    query = (
+        query
+        .outerjoin(ProjectRoleModel, and_(
+            ProjectRoleModel.project_id == ProjectModel.id,
+            ProjectRoleModel.is_filled == False
         ))
+        .add_columns(
+            ProjectRoleModel.skill_id,
+            ProjectRoleModel.slots_available - ProjectRoleModel.slots_filled,
+            payment_score,
+            ProjectRoleModel.payment_amount
+        )
+        # Id order makes the stable sort below break score ties by id
+        .order_by(ProjectModel.id)
+    )
+    rows = (await db.execute(query)).all()
+    if not rows:
+        return []
+    
+    ordinals = {}
+    role_project = np.fromiter(
+        (ordinals.setdefault(row[0], len(ordinals)) for row in rows), dtype=np.intp, count=len(rows)
+    )
+    project_ids = np.array(list(ordinals), dtype=object)
+    numeric = np.array([row[1:] for row in rows], dtype=float)
+    _, first_rows = np.unique(role_project, return_index=True)
+    # (distance_km, updated epoch) per project
+    project_features = numeric[first_rows][:, [1, 0]]
+    
+    # Later pages score against the first page's clock so recency can't reshuffle them
+    now, after_key, after_id = decode_cursor(cursor, 3) if cursor else (time.time(), None, None)
+    scores = project_relevance(role_project, project_features, numeric[:, 2:], user_skill_ids, now)
+    order = np.argsort(-scores, kind="stable")
+    
+    if cursor:
+        keys = -scores
+        after = (keys > after_key) | ((keys == after_key) & (project_ids > after_id).astype(bool))
+        order = order[after[order]]
+    
+    page = order[:limit]
+    if len(order) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor([now, float(-scores[page[-1]]), project_ids[page[-1]]])
+    
+    page_ids = project_ids[page].tolist()
+    result = await db.execute(select(ProjectModel).options(OPEN_ROLES).where(ProjectModel.id.in_(page_ids)))
+    projects = {project.id: project for project in result.scalars()}
     
+    return [
+        project_search_result(projects[project_id], None if np.isnan(distance) else float(distance))
+        for project_id, distance in zip(page_ids, project_features[page, 0])
+        if project_id in projects
+    ]
+
+@router.get("/projects", response_model=list[ProjectSearchResult])
+async def search_projects(
+    skill_id: int | None = Query(None),
+    project_type: str | None = Query(None),
+    latitude: float | None = Query(None),
+    longitude: float | None = Query(None),
+    max_distance_km: float | None = Query(None),
+    sort: Literal["distance", "relevance"] = Query("distance"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    accept: str | None = Header(None),
+    response: Response = None,
+    credentials = Depends(optional_security),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search for projects. Filter by skill, type, and location.
+    Nearest first when coordinates are given; the next page's cursor is in X-Next-Cursor.
+    Pages are cached until a write touches a project on them or matching their filters.
+    sort=relevance blends distance, roles matching the signed-in user's skills, pay,
+    recency and open slots instead (not cached).
+    With Accept: application/x-ndjson every match is streamed instead (unordered, no paging).
+    """
+    
+    if project_type:
+        try:
+            project_type = ProjectTypeEnum(project_type)
+        except ValueError:
+            # An unknown type matches no project; answer with an empty result, not a 422
+            if wants_ndjson(accept):
+                return StreamingResponse(iter(()), media_type=NDJSON)
+            return []
+    
+    if wants_ndjson(accept):
+        query, _ = project_search_query(skill_id, project_type, latitude, longitude, max_distance_km)
+        return stream_ndjson(query, project_search_result)
+    
+    if sort == "relevance":
+        # Only relevance looks at who is asking, so only it pays for the user lookup
+        current_user = await get_optional_user(credentials, db)
+        return await relevance_page(
+            db, (skill_id, project_type, latitude, longitude, max_distance_km),
+            current_user, cursor, limit, response
+        )
+    
+    # Normalize so equivalent queries share a cache entry (4 decimals is ~11 m)
     if latitude and longitude:
-        results.sort(key=lambda x: x.distance_km if x.distance_km else float('inf'))
+        latitude, longitude = round(latitude, 4), round(longitude, 4)
+    params = {
+        "skill_id": skill_id,
+        "project_type": project_type.value if project_type else None,
+        "latitude": latitude,
+        "longitude": longitude,
+        "max_distance_km": max_distance_km,
+    }
+    cache_key = (*params.values(), limit, cursor)
     
+    page = project_search_cache.get(cache_key)
+    if page is None:
+        query, distance_key = project_search_query(
+            skill_id, project_type, latitude, longitude, max_distance_km
+        )
+        
+        # Top-k in SQL, resumed from a (distance, id) cursor
+        sort_keys = [key for key in (distance_key, ProjectModel.id) if key is not None]
+        result = await db.execute(keyset_page(query, sort_keys, cursor, limit))
+        rows, next_cursor = split_page(result.all(), limit, len(sort_keys))
+        
+        page = (
+            [project_search_result(project, distance) for project, distance, *_ in rows],
+            next_cursor
+        )
+        project_search_cache.put(cache_key, params, [row[0].id for row in rows], page)
+    
+    results, next_cursor = page
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return results
 
+def user_search_query(name, profession, wanted_skills, skill_match, latitude, longitude, max_distance_km):
+    """Profiles matching the filters with skills eager-loaded; returns (query, distance_key), query None when nothing can match"""
+    query = select(UserProfileModel).options(selectinload(UserProfileModel.skills))
+    
+    if name:
+        query = query.where(UserProfileModel.name.ilike(f"%{name}%"))
+    
+    if profession:
+        query = query.where(UserProfileModel.profession.ilike(f"%{profession}%"))
+    
+    if wanted_skills and crew_skills.loaded:
+        # Set algebra over the skill postings replaces per-profile skill checks
+        profile_ids = crew_skills.match(wanted_skills, match_all=skill_match == "all")
+        if not profile_ids:
+            return None, None
+        query = query.where(
+            UserProfileModel.id == any_(literal(profile_ids, ARRAY(UUID(as_uuid=True))))
+        )
+    elif wanted_skills and skill_match == "all":
+        for wanted in wanted_skills:
+            query = query.where(
+                exists().where(
+                    user_skills.c.user_profile_id == UserProfileModel.id,
+                    user_skills.c.skill_id == wanted
+                )
+            )
+    elif wanted_skills:
+        query = query.where(
+            exists().where(
+                user_skills.c.user_profile_id == UserProfileModel.id,
+                user_skills.c.skill_id.in_(wanted_skills)
+            )
+        )
+    
+    return with_distance(
+        query, UserProfileModel, profile_locations, latitude, longitude, max_distance_km
+    )
+
+def user_search_result(profile, distance) -> UserSearchResult:
+    return UserSearchResult(
+        id=str(profile.id),
+        user_id=str(profile.user_id),
+        name=profile.name,
+        profession=profile.profession,
+        city=profile.city,
+        state=profile.state,
+        country=profile.country,
+        distance_km=round(distance, 2) if distance else None,
+        profile_photo_url=profile.profile_photo_url,
+        skills=[{"id": s.id, "name": s.name, "category": s.category} for s in profile.skills]
+    )
+
 @router.get("/users", response_model=list[UserSearchResult])
 async def search_users(
     name: str | None = Query(None),
     profession: str | None = Query(None),
     skill_id: int | None = Query(None),
+    skill_ids: list[int] | None = Query(None, max_length=SEARCH_MAX_SKILL_IDS),
+    skill_match: Literal["all", "any"] = Query("all"),
     latitude: float | None = Query(None),
     longitude: float | None = Query(None),
     max_distance_km: float | None = Query(None),
+    sort: Literal["distance", "relevance"] = Query("distance"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None),
+    accept: str | None = Header(None),
+    response: Response = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """Search for users. Filter by name, profession, skill, and location."""
+    """
+    Search for users. Filter by name, profession, skills, and location.
+    skill_ids with skill_match=all|any combines up to SEARCH_MAX_SKILL_IDS skills (skill_id is one more).
+    sort=relevance ranks name/profession matches by trigram similarity first.
+    Pages through X-Next-Cursor like /search/projects, or streams NDJSON the same way.
+    """
     
-    query = select(UserProfileModel)
+    wanted_skills = set(skill_ids or [])
+    if skill_id:
+        wanted_skills.add(skill_id)
     
-    if name:
-        query = query.where(UserProfileModel.name.ilike(f"%{name}%"))
+    query, distance_key = user_search_query(
+        name, profession, wanted_skills, skill_match, latitude, longitude, max_distance_km
+    )
     
-    if profession:
-        query = query.where(UserProfileModel.profession.ilike(f"%{profession}%"))
+    if wants_ndjson(accept):
+        if query is None:
+            return StreamingResponse(iter(()), media_type=NDJSON)
+        return stream_ndjson(query, user_search_result)
+    
+    if query is None:
+        return []
+    
+    sort_keys = [distance_key, UserProfileModel.id]
+    if sort == "relevance" and (name or profession):
+        scores = []
+        if name:
+            scores.append(func.word_similarity(name, UserProfileModel.name, type_=Float))
+        if profession:
+            scores.append(func.coalesce(func.word_similarity(profession, UserProfileModel.profession, type_=Float), 0))
+        relevance = scores[0] if len(scores) == 1 else func.greatest(*scores)
+        # Negated so every key sorts ascending
+        sort_keys.insert(0, -relevance)
+    sort_keys = [key for key in sort_keys if key is not None]
+    
+    result = await db.execute(keyset_page(query, sort_keys, cursor, limit))
+    rows, next_cursor = split_page(result.all(), limit, len(sort_keys))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     
-    result = await db.execute(query)
-    profiles = result.scalars().all()
+    return [user_search_result(profile, row_distance) for profile, row_distance, *_ in rows]
+
+@router.get("/feed", response_model=list[FeedItem])
+async def get_project_feed(
+    max_distance_km: float | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Projects for me: visible projects with open roles for the current user's skills,
+    most matching roles first, then nearest to the profile location.
+    """
     
-    results = []
-    for profile in profiles:
-        # ✅ FIXED: was user_skills.c.user_id == profile.user_id  (column doesn't exist)
-        #           now user_skills.c.user_profile_id == profile.id  (correct FK)
+    # Get profile
+    result = await db.execute(
+        select(UserProfileModel).where(UserProfileModel.user_id == current_user.id)
+    )
+    profile = result.scalar_one_or_none()
+    if not profile:
+        raise HTTPException(400, "Create profile first")
+    
+    if project_feed.loaded:
+        matches = project_feed.matches(profile.id)
+    else:
         result = await db.execute(
-            select(SkillModel)
-            .join(user_skills)
-            .where(user_skills.c.user_profile_id == profile.id)
+            select(ProjectRoleModel.project_id, func.count())
+            .join(ProjectModel, ProjectModel.id == ProjectRoleModel.project_id)
+            .join(user_skills, user_skills.c.skill_id == ProjectRoleModel.skill_id)
+            .where(
+                user_skills.c.user_profile_id == profile.id,
+                ProjectModel.status == ProjectStatusEnum.ACTIVE,
+                ProjectModel.is_fully_staffed == False,
+                ProjectRoleModel.is_filled == False
+            )
+            .group_by(ProjectRoleModel.project_id)
         )
-        skills = result.scalars().all()
-        
-        if skill_id:
-            if not any(s.id == skill_id for s in skills):
-                continue
-        
-        distance = None
-        if latitude and longitude and profile.latitude and profile.longitude:
-            distance = haversine(longitude, latitude, profile.longitude, profile.latitude)
-            if max_distance_km and distance > max_distance_km:
-                continue
-        
-        skills_data = [{"id": s.id, "name": s.name, "category": s.category} for s in skills]
-        
-        results.append(UserSearchResult(
-            id=str(profile.id),
-            user_id=str(profile.user_id),
-            name=profile.name,
-            profession=profile.profession,
-            city=profile.city,
-            state=profile.state,
-            country=profile.country,
-            distance_km=round(distance, 2) if distance else None,
-            profile_photo_url=profile.profile_photo_url,
-            skills=skills_data
-        ))
+        matches = dict(result.all())
+    if not matches:
+        return []
     
-    if latitude and longitude:
-        results.sort(key=lambda x: x.distance_km if x.distance_km else float('inf'))
+    project_ids = np.array(list(matches), dtype=object)
+    matching_roles = np.fromiter(matches.values(), dtype=np.int64, count=len(matches))
+    if profile.latitude is not None and profile.longitude is not None:
+        distances = project_locations.distances(profile.latitude, profile.longitude, project_ids)
+    else:
+        distances = np.full(len(project_ids), np.nan)
+    
+    candidates = np.arange(len(project_ids))
+    if max_distance_km and profile.latitude is not None and profile.longitude is not None:
+        # Projects without coordinates stay in, as in radius searches
+        candidates = np.flatnonzero(np.isnan(distances) | (distances <= max_distance_km))
+    order = np.lexsort((np.nan_to_num(distances[candidates], nan=NO_DISTANCE), -matching_roles[candidates]))
+    page = candidates[order[:limit]]
+    
+    page_ids = project_ids[page].tolist()
+    result = await db.execute(select(ProjectModel).options(OPEN_ROLES).where(ProjectModel.id.in_(page_ids)))
+    projects = {project.id: project for project in result.scalars()}
     
-    return results
\ No newline at end of file
+    return [
+        FeedItem(
+            **project_search_result(projects[project_ids[i]], None if np.isnan(distances[i]) else float(distances[i])).model_dump(),
+            matching_roles=int(matching_roles[i])
+        )
+        for i in page.tolist()
+        if project_ids[i] in projects
+    ]
+
+@router.get("/suggestions")
+async def get_suggestions(
+    q: str = Query(..., min_length=1),
+    type: Literal["skills", "projects", "professions"] | None = Query(None),
+    limit: int = Query(MAX_SUGGESTIONS, ge=1, le=MAX_SUGGESTIONS)
+):
+    """Autocomplete skills, project names and professions from the in-memory prefix index."""
+    return {"suggestions": search_suggestions.complete(q, type, limit)}
+
+@router.get("/popular-skills")
+async def get_popular_skills(
+    sort: Literal["open_slots", "holders"] = Query("open_slots"),
+    limit: int | None = Query(None, ge=1)
+):
+    """
+    Skills ranked by open role slots on active projects (demand) or by how many
+    profiles list them (supply). Counts come from maintained counters, no GROUP BY.
+    """
+    return {"skills": skill_facets.popular(sort, limit)}
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss counters for the /search/projects result cache."""
+    return project_search_cache.stats()
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from database.initialization import get_db
 from database.schemas import SkillModel
 from utils.auth import get_current_user
+from utils import search_indexes
+from utils.etag import make_etag, etag_matches, not_modified
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/skills", tags=["Skills"])
@@ -42,6 +44,8 @@ async def create_skill(
     await db.commit()
     await db.refresh(skill)
     
+    search_indexes.skill_created(skill)
+    
     return SkillResponse(
         id=skill.id,
         name=skill.name,
@@ -52,9 +56,19 @@ async def create_skill(
 @router.get("/list", response_model=list[SkillResponse])
 async def list_skills(
     category: str | None = None,
+    if_none_match: str | None = Header(None),
+    response: Response = None,
     db: AsyncSession = Depends(get_db)
 ):
-    """List all skills, optionally filtered by category."""
+    """
+    List all skills, optionally filtered by category.
+    Skills are only ever added, so (count, max id) versions the list for ETag/304.
+    """
+    
+    version = await db.execute(select(func.count(), func.max(SkillModel.id)))
+    etag = make_etag(category, *version.one())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
     
     query = select(SkillModel)
     
@@ -64,6 +78,7 @@ async def list_skills(
     result = await db.execute(query.order_by(SkillModel.name))
     skills = result.scalars().all()
     
+    response.headers["ETag"] = etag
     return [
         SkillResponse(
             id=skill.id,
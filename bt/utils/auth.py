@@ -42,6 +42,7 @@ from database.schemas import UserModel, RefreshTokenModel
 # =======================
 ph = PasswordHasher()
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 # =======================
 # Utility Functions
@@ -167,4 +168,22 @@ async def get_current_user(
         )
 
     print(f"✅ Authenticated user: {user.email}")
-    return user
\ No newline at end of file
+    return user
+
+
+async def get_optional_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    db: AsyncSession = Depends(get_db),
+) -> UserModel | None:
+    """
+    Authenticated user when a valid bearer token is sent, None for anonymous requests.
+    An expired or invalid token also counts as anonymous, so public pages keep working.
+    """
+    if credentials is None:
+        return None
+    try:
+        return await get_current_user(credentials, db)
+    except HTTPException as e:
+        if e.status_code == status.HTTP_401_UNAUTHORIZED:
+            return None
+        raise
@@ -0,0 +1,148 @@
+from collections import Counter
+
+import numpy as np
+from sqlalchemy import select, func
+
+from database.schemas import ProjectModel, ProjectMemberModel, ProjectStatusEnum, UserProfileModel
+from utils.geo_index import haversine_km
+from utils.relevance import half_life
+from utils.skill_index import SkillBitmapIndex, crew_skills
+
+# Each feature is scaled to [0, 1] before weighting
+CANDIDATE_WEIGHTS = {
+    "skill_match": 0.40,
+    "distance": 0.25,
+    "experience": 0.15,
+    "availability": 0.20,
+}
+# Holding another skill from the role's category counts this much of an exact match
+RELATED_SKILL_MATCH = 0.35
+CANDIDATE_DISTANCE_HALF_LIFE_KM = 50.0
+EXPERIENCE_CAP_YEARS = 15
+
+
+class CandidateIndex:
+    """
+    Profile columns (user, coordinates, experience, active memberships) aligned with
+    the crew_skills ordinals. The skill postings then act as a sparse skill x profile
+    matrix and every candidate for a role is scored with array operations.
+    """
+
+    def __init__(self, skills: SkillBitmapIndex):
+        self.skills = skills
+        self.loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._user_ids = np.empty(0, dtype=object)
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+        self._years = np.empty(0)
+        self._busy = np.empty(0, dtype=np.int32)
+        self._ordinal_by_user: dict = {}
+        self._memberships: Counter = Counter()
+
+    def _fit(self, size: int):
+        """Grow the columns to cover `size` ordinals"""
+        if size <= len(self._years):
+            return
+        extra = max(size, 2 * len(self._years), 1024) - len(self._years)
+        self._user_ids = np.concatenate([self._user_ids, np.empty(extra, dtype=object)])
+        self._lat = np.concatenate([self._lat, np.full(extra, np.nan)])
+        self._lon = np.concatenate([self._lon, np.full(extra, np.nan)])
+        self._years = np.concatenate([self._years, np.full(extra, np.nan)])
+        self._busy = np.concatenate([self._busy, np.zeros(extra, dtype=np.int32)])
+
+    def load(self, profiles, memberships):
+        """
+        Replace the contents from (profile_id, user_id, latitude, longitude, years_of_experience)
+        rows and (user_id, active project memberships) rows
+        """
+        self._reset()
+        self._memberships.update(dict(memberships))
+        for profile_id, user_id, latitude, longitude, years in profiles:
+            self.profile_saved(profile_id, user_id, latitude, longitude, years)
+        self.loaded = True
+
+    def profile_saved(self, profile_id, user_id, latitude, longitude, years):
+        ordinal = self.skills.ordinal(profile_id)
+        self._fit(ordinal + 1)
+        self._user_ids[ordinal] = user_id
+        self._lat[ordinal] = np.nan if latitude is None else latitude
+        self._lon[ordinal] = np.nan if longitude is None else longitude
+        self._years[ordinal] = np.nan if years is None else years
+        self._busy[ordinal] = self._memberships[user_id]
+        self._ordinal_by_user[user_id] = ordinal
+
+    def memberships_changed(self, user_ids, delta: int):
+        """Users joined (delta > 0) or left (delta < 0) active projects"""
+        for user_id in user_ids:
+            self._memberships[user_id] += delta
+            if self._memberships[user_id] <= 0:
+                del self._memberships[user_id]
+            ordinal = self._ordinal_by_user.get(user_id)
+            if ordinal is not None:
+                self._busy[ordinal] = self._memberships[user_id]
+
+    def rank(self, skill_id: int, related_skill_ids, latitude, longitude, exclude_user_ids, limit: int):
+        """
+        Top profiles for a role needing skill_id, best first. Returns (profile_ids, scores,
+        distances_km, available); only profiles holding the skill or a related one compete.
+        """
+        self._fit(len(self.skills))
+        skill_match = np.zeros(len(self._years))
+        for related in related_skill_ids:
+            skill_match[self.skills.posting(related)] = RELATED_SKILL_MATCH
+        skill_match[self.skills.posting(skill_id)] = 1.0
+
+        excluded = [self._ordinal_by_user[user_id] for user_id in exclude_user_ids if user_id in self._ordinal_by_user]
+        skill_match[excluded] = 0
+        candidates = np.flatnonzero(skill_match)
+
+        if latitude is not None and longitude is not None:
+            distances = haversine_km(latitude, longitude, self._lat[candidates], self._lon[candidates])
+        else:
+            distances = np.full(len(candidates), np.nan)
+        available = self._busy[candidates] == 0
+
+        features = {
+            "skill_match": skill_match[candidates],
+            "distance": half_life(distances, CANDIDATE_DISTANCE_HALF_LIFE_KM),
+            "experience": np.minimum(np.nan_to_num(self._years[candidates], nan=0.0) / EXPERIENCE_CAP_YEARS, 1.0),
+            "availability": available.astype(float),
+        }
+        scores = sum(weight * features[name] for name, weight in CANDIDATE_WEIGHTS.items())
+
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return self.skills.keys(candidates[top]), scores[top], distances[top], available[top]
+
+
+crew_candidates = CandidateIndex(crew_skills)
+
+
+async def load_candidate_index(db):
+    # Columns follow crew_skills ordinals, so that index has to be in place first
+    if not crew_skills.loaded:
+        raise RuntimeError("crew skill index is not loaded")
+
+    result = await db.execute(
+        select(
+            UserProfileModel.id,
+            UserProfileModel.user_id,
+            UserProfileModel.latitude,
+            UserProfileModel.longitude,
+            UserProfileModel.years_of_experience
+        )
+    )
+    profiles = result.all()
+    result = await db.execute(
+        select(ProjectMemberModel.user_id, func.count())
+        .join(ProjectModel, ProjectModel.id == ProjectMemberModel.project_id)
+        .where(ProjectModel.status == ProjectStatusEnum.ACTIVE)
+        .group_by(ProjectMemberModel.user_id)
+    )
+    crew_candidates.load(profiles, result.all())
@@ -0,0 +1,225 @@
+import itertools
+from math import radians, cos, floor
+
+import numpy as np
+from sqlalchemy import select
+
+from database.schemas import ProjectModel, UserProfileModel
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.195  # along a meridian, for EARTH_RADIUS_KM
+
+
+def haversine_km(latitude, longitude, latitudes, longitudes):
+    """Vectorized great-circle distance in km from one point to arrays of points (degrees)"""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(latitudes)
+    dlat = (lat2 - lat1) / 2
+    dlon = np.radians(np.asarray(longitudes) - longitude) / 2
+    a = np.sin(dlat) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float):
+    """
+    Return (min_lat, max_lat, min_lon, max_lon) enclosing a radius around a point.
+    Longitudes are unbounded (-180, 180) near the poles; min_lon > max_lon means
+    the box wraps around the antimeridian.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = latitude - dlat, latitude + dlat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    # Widest longitude span is at the latitude closest to a pole
+    dlon = dlat / cos(radians(max(abs(min_lat), abs(max_lat))))
+    if dlon >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+
+    min_lon, max_lon = longitude - dlon, longitude + dlon
+    if min_lon < -180:
+        min_lon += 360
+    if max_lon > 180:
+        max_lon -= 360
+    return min_lat, max_lat, min_lon, max_lon
+
+
+class GeoIndex:
+    """
+    Columnar coordinate store with a fixed lat/lon grid for radius pruning.
+    Rows live in NumPy arrays addressed by slot; freed slots are reused so
+    updates never reshuffle the arrays.
+
+    Each worker process holds its own copy, loaded at startup and updated only by the
+    writes that worker serves; writes handled by other workers reach it at the next
+    restart. Treat query results as candidates and re-check them against the table.
+    """
+
+    def __init__(self, cell_degrees: float = 0.5):
+        self.cell_degrees = cell_degrees
+        self._cols = int(360 / cell_degrees) + 1
+        self.loaded = False
+        self._reset(0)
+
+    def _reset(self, capacity: int):
+        self._keys = np.empty(capacity, dtype=object)
+        self._lat = np.zeros(capacity)
+        self._lon = np.zeros(capacity)
+        self._cell = np.full(capacity, -1, dtype=np.int64)
+        self._slots: dict = {}
+        self._free: list[int] = []
+        self._cells: dict[int, set[int]] = {}
+        self._size = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _cell_of(self, latitude, longitude):
+        row = np.floor((np.asarray(latitude) + 90) / self.cell_degrees).astype(np.int64)
+        col = np.floor((np.asarray(longitude) + 180) / self.cell_degrees).astype(np.int64)
+        return row * self._cols + col
+
+    def _grow(self):
+        capacity = max(1024, len(self._keys) * 2)
+        extra = capacity - len(self._keys)
+        self._keys = np.concatenate([self._keys, np.empty(extra, dtype=object)])
+        self._lat = np.concatenate([self._lat, np.zeros(extra)])
+        self._lon = np.concatenate([self._lon, np.zeros(extra)])
+        self._cell = np.concatenate([self._cell, np.full(extra, -1, dtype=np.int64)])
+
+    def load(self, rows):
+        """Replace the index contents with (key, latitude, longitude) rows"""
+        rows = [row for row in rows if row[1] is not None and row[2] is not None]
+        self._reset(len(rows))
+        if rows:
+            keys, lats, lons = zip(*rows)
+            self._keys[:] = keys
+            self._lat[:] = lats
+            self._lon[:] = lons
+            self._cell[:] = self._cell_of(self._lat, self._lon)
+            self._slots = {key: slot for slot, key in enumerate(keys)}
+            self._size = len(rows)
+
+            # Group slots by cell with one sort instead of per-row inserts
+            order = np.argsort(self._cell, kind="stable")
+            cells, starts = np.unique(self._cell[order], return_index=True)
+            for cell, slots in zip(cells.tolist(), np.split(order, starts[1:])):
+                self._cells[cell] = set(slots.tolist())
+        self.loaded = True
+
+    def upsert(self, key, latitude: float | None, longitude: float | None):
+        """Insert or move a point. Missing coordinates remove it."""
+        if latitude is None or longitude is None:
+            self.remove(key)
+            return
+
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self._size == len(self._keys):
+                    self._grow()
+                slot = self._size
+                self._size += 1
+            self._slots[key] = slot
+            self._keys[slot] = key
+        else:
+            self._detach(slot)
+
+        cell = int(self._cell_of(latitude, longitude))
+        self._lat[slot] = latitude
+        self._lon[slot] = longitude
+        self._cell[slot] = cell
+        self._cells.setdefault(cell, set()).add(slot)
+
+    def _detach(self, slot: int):
+        cell = int(self._cell[slot])
+        self._cells[cell].discard(slot)
+        if not self._cells[cell]:
+            del self._cells[cell]
+
+    def remove(self, key):
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        self._detach(slot)
+        self._keys[slot] = None
+        self._cell[slot] = -1
+        self._free.append(slot)
+
+    def _candidate_slots(self, latitude: float, longitude: float, radius_km: float | None):
+        if radius_km is None:
+            return np.flatnonzero(self._cell[:self._size] >= 0)
+
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+        rows = range(
+            floor((min_lat + 90) / self.cell_degrees),
+            floor((max_lat + 90) / self.cell_degrees) + 1
+        )
+        first_col = floor((min_lon + 180) / self.cell_degrees)
+        last_col = floor((max_lon + 180) / self.cell_degrees)
+        if first_col <= last_col:
+            cols = range(first_col, last_col + 1)
+        else:
+            cols = itertools.chain(range(first_col, self._cols), range(0, last_col + 1))
+        cols = list(cols)
+
+        # Large radii cover more grid cells than are occupied; walk the occupied ones
+        if len(rows) * len(cols) > len(self._cells):
+            row_range = (rows.start, rows.stop)
+            col_set = set(cols)
+            buckets = [
+                slots for cell, slots in self._cells.items()
+                if row_range[0] <= cell // self._cols < row_range[1] and cell % self._cols in col_set
+            ]
+        else:
+            buckets = [
+                self._cells[cell]
+                for cell in (row * self._cols + col for row in rows for col in cols)
+                if cell in self._cells
+            ]
+        return np.fromiter(
+            itertools.chain.from_iterable(buckets),
+            dtype=np.int64,
+            count=sum(len(b) for b in buckets)
+        )
+
+    def query(self, latitude: float, longitude: float, radius_km: float | None = None):
+        """Return (keys, distances_km) for points within radius_km, nearest first"""
+        slots = self._candidate_slots(latitude, longitude, radius_km)
+        distances = haversine_km(latitude, longitude, self._lat[slots], self._lon[slots])
+
+        if radius_km is not None:
+            within = distances <= radius_km
+            slots, distances = slots[within], distances[within]
+
+        order = np.argsort(distances, kind="stable")
+        return self._keys[slots[order]].tolist(), distances[order]
+
+    def distances(self, latitude: float, longitude: float, keys):
+        """Distances in km from a point to each key, NaN for keys without coordinates"""
+        slots = np.fromiter((self._slots.get(key, -1) for key in keys), dtype=np.int64)
+        known = slots >= 0
+        distances = np.full(len(slots), np.nan)
+        distances[known] = haversine_km(latitude, longitude, self._lat[slots[known]], self._lon[slots[known]])
+        return distances
+
+
+project_locations = GeoIndex()
+profile_locations = GeoIndex()
+
+
+async def load_geo_indexes(db):
+    """Build the project and profile geo indexes from the database"""
+    result = await db.execute(
+        select(ProjectModel.id, ProjectModel.latitude, ProjectModel.longitude)
+        .where(ProjectModel.latitude.isnot(None), ProjectModel.longitude.isnot(None))
+    )
+    project_locations.load(result.all())
+
+    result = await db.execute(
+        select(UserProfileModel.id, UserProfileModel.latitude, UserProfileModel.longitude)
+        .where(UserProfileModel.latitude.isnot(None), UserProfileModel.longitude.isnot(None))
+    )
+    profile_locations.load(result.all())
@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_DECODERS = {
+    "u": UUID,
+    "t": datetime.fromisoformat,
+    "f": float,
+    "v": lambda value: value,
+}
+
+
+def encode_cursor(values) -> str:
+    """Opaque, URL-safe cursor for the sort-key values of the last row on a page"""
+    tagged = []
+    for value in values:
+        if isinstance(value, UUID):
+            tagged.append(["u", str(value)])
+        elif isinstance(value, datetime):
+            tagged.append(["t", value.isoformat()])
+        elif isinstance(value, float):
+            # repr keeps full precision and spells infinity as 'inf'
+            tagged.append(["f", repr(value)])
+        else:
+            tagged.append(["v", value])
+    raw = json.dumps(tagged, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_count: int) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = [_DECODERS[tag](value) for tag, value in json.loads(raw)]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+    if len(values) != key_count:
+        raise HTTPException(400, "Invalid cursor")
+    return values
+
+
+def keyset_page(query, sort_keys: list, cursor: str | None, limit: int, descending: bool = False):
+    """
+    Order a query by non-null sort keys (all in one direction, the last one unique),
+    resume after the cursor and fetch one row beyond the page to detect a next page.
+    The key values are appended to each row for split_page.
+    """
+    if cursor:
+        after = tuple_(*sort_keys)
+        values = tuple_(*decode_cursor(cursor, len(sort_keys)))
+        query = query.where(after < values if descending else after > values)
+
+    return (
+        query
+        .add_columns(*(key.label(f"sort_key_{i}") for i, key in enumerate(sort_keys)))
+        .order_by(*(key.desc() if descending else key.asc() for key in sort_keys))
+        .limit(limit + 1)
+    )
+
+
+def split_page(rows, limit: int, key_count: int):
+    """Trim the look-ahead row and return (rows, next_cursor or None)"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1][-key_count:])
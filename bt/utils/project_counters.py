@@ -0,0 +1,119 @@
+from sqlalchemy import update, select, func, or_, exists, and_
+from sqlalchemy.orm import aliased, selectinload
+
+from database.schemas import (
+    ProjectModel, ProjectRoleModel, ProjectMemberModel, ApplicationModel, ApplicationStatusEnum
+)
+from utils import search_indexes
+
+
+def counter_update(project_id, **deltas):
+    """
+    UPDATE applying deltas to a project's counters in SQL (col = col + delta), so
+    concurrent requests never overwrite each other's increments. updated_at is kept
+    as is: counters are not an edit of the project, and bumping it on every
+    application would bust the project ETag.
+    """
+    values = {getattr(ProjectModel, name): getattr(ProjectModel, name) + delta for name, delta in deltas.items()}
+    values[ProjectModel.updated_at] = ProjectModel.updated_at
+    return (
+        update(ProjectModel)
+        .where(ProjectModel.id == project_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def staffing_update(project_id):
+    """
+    UPDATE recomputing is_fully_staffed from the project's roles, returning the flag.
+    Run it after counter_update has locked the project row: as a separate statement it
+    sees the roles filled by accepts that held the lock before, which a subquery in the
+    locking UPDATE itself would not.
+    """
+    open_role_left = exists().where(
+        ProjectRoleModel.project_id == project_id,
+        ProjectRoleModel.is_filled == False
+    )
+    return (
+        update(ProjectModel)
+        .where(ProjectModel.id == project_id)
+        .values(is_fully_staffed=~open_role_left)
+        .returning(ProjectModel.is_fully_staffed)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def reconcile_project_counters(db) -> list:
+    """
+    Recount every project's counters and staffing flag from the source tables, fix the
+    ones that drifted and return their ids
+    """
+    members = (
+        select(func.count())
+        .where(ProjectMemberModel.project_id == ProjectModel.id)
+        .scalar_subquery()
+    )
+    open_slots = (
+        select(func.coalesce(func.sum(func.greatest(ProjectRoleModel.slots_available - ProjectRoleModel.slots_filled, 0)), 0))
+        .where(ProjectRoleModel.project_id == ProjectModel.id)
+        .scalar_subquery()
+    )
+    pending = (
+        select(func.count())
+        .where(
+            ApplicationModel.project_id == ProjectModel.id,
+            ApplicationModel.status == ApplicationStatusEnum.PENDING
+        )
+        .scalar_subquery()
+    )
+    # Staffed once it has roles and none of them is still open
+    fully_staffed = and_(
+        exists().where(ProjectRoleModel.project_id == ProjectModel.id),
+        ~exists().where(
+            ProjectRoleModel.project_id == ProjectModel.id,
+            ProjectRoleModel.is_filled == False
+        )
+    )
+    
+    # Self-join on the pre-update row so RETURNING can tell which staffing flags flipped
+    before = aliased(ProjectModel)
+    result = await db.execute(
+        update(ProjectModel)
+        .where(
+            before.id == ProjectModel.id,
+            or_(
+                ProjectModel.member_count != members,
+                ProjectModel.open_slots != open_slots,
+                ProjectModel.pending_applications != pending,
+                ProjectModel.is_fully_staffed != fully_staffed
+            )
+        )
+        .values(
+            member_count=members,
+            open_slots=open_slots,
+            pending_applications=pending,
+            is_fully_staffed=fully_staffed
+        )
+        .returning(ProjectModel.id, ProjectModel.is_fully_staffed != before.is_fully_staffed)
+        .execution_options(synchronize_session=False)
+    )
+    rows = result.all()
+    await db.commit()
+    
+    drifted = [project_id for project_id, _ in rows]
+    flipped = [project_id for project_id, staffing_changed in rows if staffing_changed]
+    if drifted:
+        print(f"⚠️  Repaired counter/staffing drift on {len(drifted)} projects")
+    if flipped:
+        # Staffing decides feed and search visibility, so the in-memory indexes follow
+        result = await db.execute(
+            select(ProjectModel)
+            .where(ProjectModel.id.in_(flipped))
+            .options(selectinload(ProjectModel.roles))
+        )
+        for project in result.scalars().all():
+            search_indexes.project_staffing_changed(
+                project, [role for role in project.roles if not role.is_filled]
+            )
+    return drifted
@@ -0,0 +1,81 @@
+from collections import Counter
+
+from sqlalchemy import select
+
+from database.schemas import ProjectModel, ProjectRoleModel, ProjectStatusEnum, user_skills
+
+
+class ProjectFeed:
+    """
+    "Projects for me" matches: for every skill, how many open roles on visible projects
+    ask for it, per project. A profile's feed is combined at read time over its few
+    skills, so roles opening or filling cost one counter update whatever the number of
+    profiles holding the skill.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._open_roles: dict = {}
+        self._projects_by_skill: dict[int, Counter] = {}
+        self._profile_skills: dict = {}
+
+    def load(self, open_roles, profile_skills):
+        """Replace the contents from (role_id, project_id, skill_id) and (profile_id, skill_id) rows"""
+        self._reset()
+        for profile_id, skill_id in profile_skills:
+            self._profile_skills.setdefault(profile_id, set()).add(skill_id)
+        for role_id, project_id, skill_id in open_roles:
+            self.role_opened(role_id, project_id, skill_id)
+        self.loaded = True
+
+    def role_opened(self, role_id, project_id, skill_id: int):
+        if role_id in self._open_roles:
+            return
+        self._open_roles[role_id] = (project_id, skill_id)
+        self._projects_by_skill.setdefault(skill_id, Counter())[project_id] += 1
+
+    def role_closed(self, role_id):
+        opened = self._open_roles.pop(role_id, None)
+        if opened is None:
+            return
+        project_id, skill_id = opened
+        projects = self._projects_by_skill[skill_id]
+        projects[project_id] -= 1
+        if projects[project_id] <= 0:
+            del projects[project_id]
+            if not projects:
+                del self._projects_by_skill[skill_id]
+
+    def profile_changed(self, profile_id, old_skill_ids, new_skill_ids):
+        if new_skill_ids:
+            self._profile_skills[profile_id] = set(new_skill_ids)
+        else:
+            self._profile_skills.pop(profile_id, None)
+
+    def matches(self, profile_id) -> dict:
+        """project_id -> number of open roles matching the profile's skills"""
+        feed = Counter()
+        for skill_id in self._profile_skills.get(profile_id, ()):
+            feed.update(self._projects_by_skill.get(skill_id, ()))
+        return dict(feed)
+
+
+project_feed = ProjectFeed()
+
+
+async def load_project_feed(db):
+    result = await db.execute(
+        select(ProjectRoleModel.id, ProjectRoleModel.project_id, ProjectRoleModel.skill_id)
+        .join(ProjectModel, ProjectModel.id == ProjectRoleModel.project_id)
+        .where(
+            ProjectModel.status == ProjectStatusEnum.ACTIVE,
+            ProjectModel.is_fully_staffed == False,
+            ProjectRoleModel.is_filled == False
+        )
+    )
+    open_roles = result.all()
+    result = await db.execute(select(user_skills.c.user_profile_id, user_skills.c.skill_id))
+    project_feed.load(open_roles, result.all())
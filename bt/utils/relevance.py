@@ -0,0 +1,64 @@
+import numpy as np
+
+# Each feature is scaled to [0, 1] before weighting
+RELEVANCE_WEIGHTS = {
+    "distance": 0.30,
+    "skill_match": 0.30,
+    "payment": 0.15,
+    "recency": 0.15,
+    "open_slots": 0.10,
+}
+DISTANCE_HALF_LIFE_KM = 25.0
+RECENCY_HALF_LIFE_DAYS = 14.0
+# Within the payment feature, how much the amount counts next to the payment type
+PAYMENT_AMOUNT_SHARE = 0.3
+
+
+def half_life(values, period):
+    """1 at zero, 0.5 at one period, 0 for missing values"""
+    return np.nan_to_num(np.exp2(-np.maximum(values, 0) / period), nan=0.0)
+
+
+def _log_scaled(values):
+    """log1p(x) scaled by the candidate-set maximum, so 0..1 regardless of units"""
+    values = np.log1p(np.maximum(np.nan_to_num(values, nan=0.0), 0))
+    top = values.max(initial=0.0)
+    return values / top if top > 0 else values
+
+
+def project_relevance(role_project, project_features, role_features, user_skill_ids, now: float):
+    """
+    Score every candidate project at once.
+
+    role_project: project ordinal of each role row
+    project_features: (n_projects, 2) float array of distance_km, last update epoch (NaN when missing)
+    role_features: (n_rows, 4) float array of skill_id, open slots, payment type score,
+        payment amount; rows of projects without open roles are all NaN
+    Returns one score per project, higher is better.
+    """
+    n_projects = len(project_features)
+    distance, updated_at = project_features.T
+    skill_ids, open_slots, payment_score, payment_amount = role_features.T
+    has_role = ~np.isnan(open_slots)
+
+    matches = np.isin(skill_ids, np.fromiter(user_skill_ids, dtype=float)) & has_role
+    matched_roles = np.bincount(role_project, weights=matches, minlength=n_projects)
+
+    slots = np.bincount(role_project, weights=np.nan_to_num(open_slots, nan=0.0), minlength=n_projects)
+
+    role_payment = (
+        (1 - PAYMENT_AMOUNT_SHARE) * np.nan_to_num(payment_score, nan=0.0)
+        + PAYMENT_AMOUNT_SHARE * _log_scaled(payment_amount)
+    )
+    # A project is as attractive as its best-paid open role
+    payment = np.zeros(n_projects)
+    np.maximum.at(payment, role_project, np.where(has_role, role_payment, 0.0))
+
+    features = {
+        "distance": half_life(distance, DISTANCE_HALF_LIFE_KM),
+        "skill_match": matched_roles / (matched_roles + 1),
+        "payment": payment,
+        "recency": half_life((now - updated_at) / 86400, RECENCY_HALF_LIFE_DAYS),
+        "open_slots": _log_scaled(slots),
+    }
+    return sum(weight * features[name] for name, weight in RELEVANCE_WEIGHTS.items())
@@ -0,0 +1,117 @@
+import time
+from collections import OrderedDict
+
+from config import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL_SECONDS
+from utils.geo_index import haversine_km
+
+
+class _Entry:
+    __slots__ = ("expires_at", "params", "project_ids", "value")
+
+    def __init__(self, expires_at, params, project_ids, value):
+        self.expires_at = expires_at
+        self.params = params
+        self.project_ids = project_ids
+        self.value = value
+
+
+class ProjectSearchCache:
+    """
+    LRU + TTL cache of /search/projects pages keyed on normalized query parameters.
+    Writes invalidate exactly the entries that list the changed project or whose
+    filters the project now satisfies.
+    """
+
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._keys_by_project: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple):
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at < time.monotonic():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: tuple, params: dict, project_ids, value):
+        if key in self._entries:
+            self._drop(key)
+        entry = _Entry(time.monotonic() + self.ttl, params, frozenset(project_ids), value)
+        self._entries[key] = entry
+        for project_id in entry.project_ids:
+            self._keys_by_project.setdefault(project_id, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _drop(self, key: tuple):
+        entry = self._entries.pop(key)
+        for project_id in entry.project_ids:
+            keys = self._keys_by_project.get(project_id)
+            if keys:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_project[project_id]
+
+    @staticmethod
+    def _matches(params: dict, project_type, latitude, longitude, open_skill_ids) -> bool:
+        if params["skill_id"] and params["skill_id"] not in open_skill_ids:
+            return False
+        if params["project_type"] and params["project_type"] != project_type:
+            return False
+        if params["max_distance_km"] and params["latitude"] and params["longitude"]:
+            # Projects without coordinates pass radius filters
+            if latitude is not None and longitude is not None:
+                distance = haversine_km(params["latitude"], params["longitude"], latitude, longitude)
+                if distance > params["max_distance_km"]:
+                    return False
+        return True
+
+    def project_changed(self, project, open_skill_ids=None):
+        """
+        Invalidate pages that list the project. When open_skill_ids is given the
+        project is (still) visible with those open skills, so pages whose filters
+        it matches are dropped too, as it may now belong on them.
+        """
+        stale = set(self._keys_by_project.get(project.id, ()))
+        if open_skill_ids is not None:
+            project_type = project.project_type.value if project.project_type else None
+            stale.update(
+                key for key, entry in self._entries.items()
+                if self._matches(entry.params, project_type, project.latitude, project.longitude, open_skill_ids)
+            )
+        for key in stale:
+            self._drop(key)
+        self.invalidations += len(stale)
+
+    def clear(self):
+        """Drop every page, for writes too broad to match page by page"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_project.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+project_search_cache = ProjectSearchCache()
@@ -0,0 +1,125 @@
+"""
+Keeps the in-memory search indexes in step with the database.
+Routers call these after a successful commit so rolled-back writes never leak in.
+"""
+from collections import Counter
+
+from utils.geo_index import project_locations, profile_locations, load_geo_indexes
+from utils.suggestions import search_suggestions, load_suggestions
+from utils.skill_facets import skill_facets, load_skill_facets
+from utils.skill_index import crew_skills, load_skill_index
+from utils.search_cache import project_search_cache
+from utils.project_feed import project_feed, load_project_feed
+from utils.candidates import crew_candidates, load_candidate_index
+from database.schemas import ProjectStatusEnum
+
+# Run at startup in this order; each index loads (or fails) independently
+INDEX_LOADERS = (
+    load_geo_indexes, load_suggestions, load_skill_facets, load_skill_index, load_project_feed,
+    load_candidate_index
+)
+
+
+def open_slots_by_skill(roles) -> dict[int, int]:
+    slots = Counter()
+    for role in roles:
+        if not role.is_filled:
+            slots[role.skill_id] += role.slots_available - role.slots_filled
+    return slots
+
+
+def skill_created(skill):
+    search_suggestions.skill_added(skill.id, skill.name)
+    skill_facets.skill_added(skill.id, skill.name, skill.category)
+
+
+def profile_saved(profile, old_profession, old_skill_ids, new_skill_ids):
+    profile_locations.upsert(profile.id, profile.latitude, profile.longitude)
+    search_suggestions.profile_changed(old_profession, profile.profession, old_skill_ids, new_skill_ids)
+    skill_facets.profile_skills_changed(old_skill_ids, new_skill_ids)
+    crew_skills.profile_changed(profile.id, old_skill_ids, new_skill_ids)
+    project_feed.profile_changed(profile.id, old_skill_ids, new_skill_ids)
+    crew_candidates.profile_saved(
+        profile.id, profile.user_id, profile.latitude, profile.longitude, profile.years_of_experience
+    )
+
+
+def project_created(project, roles, refresh_cache: bool = True):
+    project_locations.upsert(project.id, project.latitude, project.longitude)
+    search_suggestions.project_changed(None, project.name)
+    open_slots = open_slots_by_skill(roles)
+    skill_facets.open_slots_changed(open_slots)
+    if refresh_cache:
+        project_search_cache.project_changed(project, open_skill_ids=set(open_slots))
+    for role in roles:
+        if not role.is_filled:
+            project_feed.role_opened(role.id, project.id, role.skill_id)
+    # The creator is the project's first member
+    crew_candidates.memberships_changed([project.creator_id], 1)
+
+
+def projects_imported(saved):
+    """
+    A committed import chunk of (project, roles) pairs. Matching every new project
+    against every cached page would scan the cache once per project, so the chunk
+    flushes the cache once instead.
+    """
+    for project, roles in saved:
+        project_created(project, roles, refresh_cache=False)
+    project_search_cache.clear()
+
+
+def project_activity_changed(project, is_active: bool, open_roles, member_user_ids):
+    """A project moved into or out of ACTIVE; open_roles are its unfilled roles"""
+    open_slots = open_slots_by_skill(open_roles)
+    crew_candidates.memberships_changed(member_user_ids, 1 if is_active else -1)
+    for role in open_roles:
+        if is_active:
+            project_feed.role_opened(role.id, project.id, role.skill_id)
+        else:
+            project_feed.role_closed(role.id)
+    search_suggestions.project_changed(
+        None if is_active else project.name,
+        project.name if is_active else None
+    )
+    skill_facets.open_slots_changed(open_slots, 1 if is_active else -1)
+    project_search_cache.project_changed(project, open_skill_ids=set(open_slots) if is_active else None)
+
+
+def project_staffing_changed(project, open_roles):
+    """is_fully_staffed was corrected outside a role change; open_roles are its unfilled roles"""
+    visible = project.status == ProjectStatusEnum.ACTIVE and not project.is_fully_staffed
+    for role in open_roles:
+        if visible:
+            project_feed.role_opened(role.id, project.id, role.skill_id)
+        else:
+            project_feed.role_closed(role.id)
+    project_search_cache.project_changed(
+        project, open_skill_ids=set(open_slots_by_skill(open_roles)) if visible else None
+    )
+
+
+def role_slots_changed(project, role, opened: int):
+    """Slots on one of the project's roles were filled (opened < 0) or freed (opened > 0)"""
+    skill_id = role.skill_id
+    is_active = project.status == ProjectStatusEnum.ACTIVE
+    if is_active:
+        skill_facets.open_slots_changed({skill_id: opened})
+    if is_active and not project.is_fully_staffed and not role.is_filled:
+        project_feed.role_opened(role.id, project.id, skill_id)
+    else:
+        project_feed.role_closed(role.id)
+    # A freed slot can bring the project back into skill-filtered searches
+    project_search_cache.project_changed(
+        project, open_skill_ids={skill_id} if is_active and opened > 0 else None
+    )
+
+
+def member_joined(project, user_id):
+    if project.status == ProjectStatusEnum.ACTIVE:
+        crew_candidates.memberships_changed([user_id], 1)
+
+
+def member_left(project, user_id):
+    if project.status == ProjectStatusEnum.ACTIVE:
+        crew_candidates.memberships_changed([user_id], -1)
@@ -0,0 +1,76 @@
+from collections import Counter
+
+from sqlalchemy import select, func
+
+from database.schemas import (
+    SkillModel, ProjectModel, ProjectRoleModel, ProjectStatusEnum, user_skills
+)
+
+
+class SkillFacets:
+    """
+    Per-skill counters kept up to date by deltas from the write paths:
+    demand is open role slots on active projects, supply is profiles listing the skill.
+    """
+
+    def __init__(self):
+        self.skills: dict[int, dict] = {}
+        self.demand: Counter = Counter()
+        self.supply: Counter = Counter()
+
+    def skill_added(self, skill_id: int, name: str, category: str | None):
+        self.skills[skill_id] = {"name": name, "category": category}
+
+    def open_slots_changed(self, slots_by_skill: dict[int, int], sign: int = 1):
+        for skill_id, slots in slots_by_skill.items():
+            self.demand[skill_id] += sign * slots
+
+    def profile_skills_changed(self, old_skill_ids, new_skill_ids):
+        old_skill_ids, new_skill_ids = set(old_skill_ids), set(new_skill_ids)
+        for skill_id in old_skill_ids - new_skill_ids:
+            self.supply[skill_id] -= 1
+        for skill_id in new_skill_ids - old_skill_ids:
+            self.supply[skill_id] += 1
+
+    def facet(self, skill_id: int) -> dict:
+        return {
+            "id": skill_id,
+            **self.skills[skill_id],
+            "open_slots": self.demand[skill_id],
+            "holders": self.supply[skill_id],
+        }
+
+    def popular(self, sort: str = "open_slots", limit: int | None = None) -> list[dict]:
+        counter = self.demand if sort == "open_slots" else self.supply
+        ranked = sorted(self.skills, key=lambda skill_id: (-counter[skill_id], self.skills[skill_id]["name"]))
+        return [self.facet(skill_id) for skill_id in ranked[:limit]]
+
+
+skill_facets = SkillFacets()
+
+
+async def load_skill_facets(db):
+    """Seed the counters once; afterwards only deltas are applied"""
+    result = await db.execute(select(SkillModel.id, SkillModel.name, SkillModel.category))
+    for skill_id, name, category in result.all():
+        skill_facets.skill_added(skill_id, name, category)
+
+    result = await db.execute(
+        select(
+            ProjectRoleModel.skill_id,
+            func.sum(ProjectRoleModel.slots_available - ProjectRoleModel.slots_filled)
+        )
+        .join(ProjectModel, ProjectModel.id == ProjectRoleModel.project_id)
+        .where(
+            ProjectModel.status == ProjectStatusEnum.ACTIVE,
+            ProjectRoleModel.is_filled == False
+        )
+        .group_by(ProjectRoleModel.skill_id)
+    )
+    skill_facets.demand = Counter(dict(result.all()))
+
+    result = await db.execute(
+        select(user_skills.c.skill_id, func.count())
+        .group_by(user_skills.c.skill_id)
+    )
+    skill_facets.supply = Counter(dict(result.all()))
@@ -0,0 +1,102 @@
+from functools import reduce
+
+import numpy as np
+from sqlalchemy import select
+
+from database.schemas import user_skills
+
+
+class SkillBitmapIndex:
+    """
+    Inverted index from skill to the profiles listing it. Profiles get dense
+    integer ordinals and every skill keeps a sorted uint32 posting array, so
+    multi-skill AND/OR queries are NumPy set operations.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._ordinals: dict = {}
+        self._keys = np.empty(0, dtype=object)
+        self._postings: dict[int, np.ndarray] = {}
+
+    def ordinal(self, key) -> int:
+        """Dense ordinal of a profile, assigned on first sight"""
+        ordinal = self._ordinals.get(key)
+        if ordinal is None:
+            ordinal = len(self._ordinals)
+            if ordinal == len(self._keys):
+                self._keys = np.concatenate([self._keys, np.empty(max(1024, ordinal), dtype=object)])
+            self._ordinals[key] = ordinal
+            self._keys[ordinal] = key
+        return ordinal
+
+    def load(self, rows):
+        """Replace the index contents with (profile_id, skill_id) rows"""
+        self._reset()
+        rows = list(rows)
+        if rows:
+            ordinals = np.fromiter((self.ordinal(key) for key, _ in rows), dtype=np.uint32, count=len(rows))
+            skills = np.fromiter((skill_id for _, skill_id in rows), dtype=np.int64, count=len(rows))
+            order = np.lexsort((ordinals, skills))
+            skills, ordinals = skills[order], ordinals[order]
+            starts = np.flatnonzero(np.diff(skills, prepend=skills[0] - 1))
+            for skill_id, posting in zip(skills[starts].tolist(), np.split(ordinals, starts[1:])):
+                self._postings[skill_id] = np.unique(posting)
+        self.loaded = True
+
+    def profile_changed(self, key, old_skill_ids, new_skill_ids):
+        old_skill_ids, new_skill_ids = set(old_skill_ids), set(new_skill_ids)
+        if old_skill_ids == new_skill_ids:
+            return
+        ordinal = self.ordinal(key)
+
+        for skill_id in old_skill_ids - new_skill_ids:
+            posting = self._postings.get(skill_id)
+            if posting is None:
+                continue
+            pos = np.searchsorted(posting, ordinal)
+            if pos < len(posting) and posting[pos] == ordinal:
+                self._postings[skill_id] = np.delete(posting, pos)
+
+        for skill_id in new_skill_ids - old_skill_ids:
+            posting = self._postings.get(skill_id, np.empty(0, dtype=np.uint32))
+            pos = np.searchsorted(posting, ordinal)
+            if pos == len(posting) or posting[pos] != ordinal:
+                self._postings[skill_id] = np.insert(posting, pos, ordinal)
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def cardinality(self, skill_id: int) -> int:
+        return len(self._postings.get(skill_id, ()))
+
+    def posting(self, skill_id: int) -> np.ndarray:
+        """Sorted ordinals of the profiles holding a skill"""
+        return self._postings.get(skill_id, np.empty(0, dtype=np.uint32))
+
+    def keys(self, ordinals) -> list:
+        return self._keys[ordinals].tolist()
+
+    def match(self, skill_ids, match_all: bool = True):
+        """Profile ids holding all (or any) of the given skills"""
+        postings = [self.posting(skill_id) for skill_id in set(skill_ids)]
+        if not postings:
+            return []
+        if match_all:
+            # Intersect smallest first so every step works on the shortest arrays
+            postings.sort(key=len)
+            ordinals = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings)
+        else:
+            ordinals = reduce(np.union1d, postings)
+        return self.keys(ordinals)
+
+
+crew_skills = SkillBitmapIndex()
+
+
+async def load_skill_index(db):
+    result = await db.execute(select(user_skills.c.user_profile_id, user_skills.c.skill_id))
+    crew_skills.load(result.all())
@@ -0,0 +1,181 @@
+import heapq
+
+from sqlalchemy import select, func
+
+from database.schemas import (
+    SkillModel, ProjectModel, UserProfileModel, ProjectStatusEnum, user_skills
+)
+
+MAX_SUGGESTIONS = 10
+
+
+class _Node:
+    __slots__ = ("children", "term", "top")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.term: str | None = None
+        # Best completions under this node as (-weight, term), sorted
+        self.top: list[tuple[int, str]] = []
+
+
+class PrefixIndex:
+    """
+    Trie over normalized terms where every node caches its top-k completions,
+    so a lookup is a walk down the prefix plus a slice.
+    """
+
+    def __init__(self, k: int = MAX_SUGGESTIONS):
+        self.k = k
+        self._root = _Node()
+        self._weights: dict[str, int] = {}
+        self._labels: dict[str, str] = {}
+
+    def __len__(self):
+        return len(self._weights)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def add(self, label: str | None, delta: int = 1):
+        """Adjust a term's weight by delta; terms at zero weight disappear"""
+        term = self.normalize(label) if label else ""
+        if not term or not delta:
+            return
+        if delta > 0:
+            self._labels[term] = " ".join(label.split())
+
+        old_weight = self._weights.get(term, 0)
+        weight = max(old_weight + delta, 0)
+        if weight:
+            self._weights[term] = weight
+        else:
+            self._weights.pop(term, None)
+            self._labels.pop(term, None)
+
+        path = [self._root]
+        for char in term:
+            path.append(path[-1].children.setdefault(char, _Node()))
+        path[-1].term = term if weight else None
+
+        for node in reversed(path):
+            if weight > old_weight:
+                # A term that only gained weight can displace others but never needs a refill
+                top = [entry for entry in node.top if entry[1] != term]
+                top.append((-weight, term))
+                top.sort()
+                node.top = top[:self.k]
+            else:
+                node.top = self._collect(node)
+
+        # Drop branches that no longer lead anywhere
+        if not weight:
+            for depth in range(len(term), 0, -1):
+                if path[depth].children or path[depth].term:
+                    break
+                del path[depth - 1].children[term[depth - 1]]
+
+    def _collect(self, node: _Node) -> list[tuple[int, str]]:
+        candidates = [entry for child in node.children.values() for entry in child.top]
+        if node.term:
+            candidates.append((-self._weights[node.term], node.term))
+        return heapq.nsmallest(self.k, candidates)
+
+    def complete(self, prefix: str, limit: int = MAX_SUGGESTIONS) -> list[tuple[str, int]]:
+        """Return up to `limit` (label, weight) completions of prefix, heaviest first"""
+        node = self._root
+        for char in self.normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(self._labels[term], -weight) for weight, term in node.top[:limit]]
+
+
+class SearchSuggestions:
+    """
+    Autocomplete over skill names, active project names and profile professions.
+    Skills are weighted by how many profiles list them, projects and professions
+    by how many rows share the name.
+    """
+
+    def __init__(self):
+        self.skills = PrefixIndex()
+        self.projects = PrefixIndex()
+        self.professions = PrefixIndex()
+        self._skill_names: dict[int, str] = {}
+
+    def skill_added(self, skill_id: int, name: str, holders: int = 0):
+        self._skill_names[skill_id] = name
+        # Every skill stays suggestible, even before anyone lists it
+        self.skills.add(name, holders + 1)
+
+    def project_changed(self, old_name: str | None, new_name: str | None):
+        """Record a project entering (old_name=None) or leaving (new_name=None) the active set"""
+        if old_name != new_name:
+            self.projects.add(old_name, -1)
+            self.projects.add(new_name, 1)
+
+    def profile_changed(
+        self,
+        old_profession: str | None,
+        new_profession: str | None,
+        old_skill_ids=(),
+        new_skill_ids=()
+    ):
+        if old_profession != new_profession:
+            self.professions.add(old_profession, -1)
+            self.professions.add(new_profession, 1)
+
+        old_skill_ids, new_skill_ids = set(old_skill_ids), set(new_skill_ids)
+        for skill_id in old_skill_ids - new_skill_ids:
+            self.skills.add(self._skill_names.get(skill_id), -1)
+        for skill_id in new_skill_ids - old_skill_ids:
+            self.skills.add(self._skill_names.get(skill_id), 1)
+
+    def complete(self, prefix: str, kind: str | None = None, limit: int = MAX_SUGGESTIONS):
+        """Top completions for one kind, or the heaviest across all kinds"""
+        sources = {
+            "skills": self.skills,
+            "projects": self.projects,
+            "professions": self.professions,
+        }
+        if kind:
+            sources = {kind: sources[kind]}
+
+        matches = [
+            {"text": label, "type": source_kind, "count": weight}
+            for source_kind, index in sources.items()
+            for label, weight in index.complete(prefix, limit)
+        ]
+        return heapq.nlargest(limit, matches, key=lambda m: m["count"])
+
+
+search_suggestions = SearchSuggestions()
+
+
+async def load_suggestions(db):
+    """Build the autocomplete index with one grouped query per source"""
+    result = await db.execute(
+        select(SkillModel.id, SkillModel.name, func.count(user_skills.c.user_profile_id))
+        .outerjoin(user_skills, user_skills.c.skill_id == SkillModel.id)
+        .group_by(SkillModel.id)
+    )
+    for skill_id, name, holders in result.all():
+        search_suggestions.skill_added(skill_id, name, holders)
+
+    result = await db.execute(
+        select(ProjectModel.name, func.count())
+        .where(ProjectModel.status == ProjectStatusEnum.ACTIVE)
+        .group_by(ProjectModel.name)
+    )
+    for name, count in result.all():
+        search_suggestions.projects.add(name, count)
+
+    result = await db.execute(
+        select(UserProfileModel.profession, func.count())
+        .where(UserProfileModel.profession.isnot(None))
+        .group_by(UserProfileModel.profession)
+    )
+    for profession, count in result.all():
+        search_suggestions.professions.add(profession, count)
@@ -36,8 +36,11 @@ const BrowseTab = () => {
   // Data states
   const [users, setUsers] = useState([]);
   const [usersLoading, setUsersLoading] = useState(false);
+  const [usersCursor, setUsersCursor] = useState(null);
   const [projects, setProjects] = useState([]);
   const [projectsLoading, setProjectsLoading] = useState(false);
+  const [projectsCursor, setProjectsCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   
   // Selected project for modal
   const [selectedProject, setSelectedProject] = useState(null);
@@ -49,42 +52,70 @@ const BrowseTab = () => {
     });
   }, []);
 
+  // Results come a page at a time; the cursor fetches the page after the last one shown
+  const projectParams = useCallback(() => {
+    const params = {};
+    if (selectedSkillId) params.skill_id = selectedSkillId;
+    if (projectTypeFilter !== 'all') params.project_type = projectTypeFilter;
+    return params;
+  }, [selectedSkillId, projectTypeFilter]);
+
+  const userParams = useCallback(() => {
+    const params = {};
+    if (selectedSkillId) params.skill_id = selectedSkillId;
+    if (searchQuery.trim()) params.name = searchQuery.trim();
+    if (userRoleFilter !== 'all') params.profession = userRoleFilter;
+    return params;
+  }, [selectedSkillId, searchQuery, userRoleFilter]);
+
   // Fetch projects
   const fetchProjects = useCallback(async () => {
     setProjectsLoading(true);
     try {
-      const params = {};
-      if (selectedSkillId) params.skill_id = selectedSkillId;
-      if (projectTypeFilter !== 'all') params.project_type = projectTypeFilter;
-      
-      const { projects: list } = await searchService.searchProjects(params);
+      const { projects: list, nextCursor } = await searchService.searchProjects(projectParams());
       setProjects(list);
+      setProjectsCursor(nextCursor);
     } catch (e) {
       console.error('Failed to search projects', e);
       setProjects([]);
+      setProjectsCursor(null);
     } finally {
       setProjectsLoading(false);
     }
-  }, [selectedSkillId, projectTypeFilter]);
+  }, [projectParams]);
 
   // Fetch users
   const fetchUsers = useCallback(async () => {
     setUsersLoading(true);
     try {
-      const params = {};
-      if (selectedSkillId) params.skill_id = selectedSkillId;
-      if (searchQuery.trim()) params.name = searchQuery.trim();
-      if (userRoleFilter !== 'all') params.profession = userRoleFilter;
-      
-      const { users: list } = await searchService.searchUsers(params);
+      const { users: list, nextCursor } = await searchService.searchUsers(userParams());
       setUsers(list);
+      setUsersCursor(nextCursor);
     } catch (e) {
       console.error('Failed to search users', e);
       setUsers([]);
+      setUsersCursor(null);
     } finally {
       setUsersLoading(false);
     }
-  }, [selectedSkillId, searchQuery, userRoleFilter]);
+  }, [userParams]);
+
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      if (browseType === 'projects') {
+        const { projects: list, nextCursor } = await searchService.searchProjects({ ...projectParams(), cursor: projectsCursor });
+        setProjects(prev => [...prev, ...list]);
+        setProjectsCursor(nextCursor);
+      } else {
+        const { users: list, nextCursor } = await searchService.searchUsers({ ...userParams(), cursor: usersCursor });
+        setUsers(prev => [...prev, ...list]);
+        setUsersCursor(nextCursor);
+      }
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   // Re-fetch when filters change
   useEffect(() => {
@@ -280,6 +311,19 @@ const BrowseTab = () => {
               onUserClick={handleUserClick}
             />
           )}
+
+          {/* Next page */}
+          {(browseType === 'projects' ? projectsCursor && !projectsLoading : usersCursor && !usersLoading) && (
+            <div className="flex justify-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-6 py-2 bg-white rounded-lg border-2 border-orange-300 text-gray-700 font-semibold hover:bg-orange-50 transition disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
 
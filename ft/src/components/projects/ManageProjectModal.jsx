@@ -10,8 +10,11 @@ import { applicationService, managementService } from '../../services/api';
  * - Role-wise filled info
  */
 const ManageProjectModal = ({ project, onClose, onUpdate }) => {
-  const [applications, setApplications] = useState([]);
+  const [pendingApplications, setPendingApplications] = useState([]);
+  const [pendingCursor, setPendingCursor] = useState(null);
+  const [acceptedApplications, setAcceptedApplications] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
   const [selectedStatus, setSelectedStatus] = useState(project.status || 'active');
@@ -21,19 +24,43 @@ const ManageProjectModal = ({ project, onClose, onUpdate }) => {
     loadApplications();
   }, []);
 
+  // Pending applicants come a page at a time (oldest first); the team is loaded in full
   const loadApplications = async () => {
     setIsLoading(true);
     try {
-      const data = await applicationService.getProjectApplications(project.id);
-      setApplications(data.applications || data || []);
+      const [pending, accepted] = await Promise.all([
+        applicationService.getProjectApplications(project.id, { status: 'pending' }),
+        applicationService.getAllProjectApplications(project.id, { status: 'accepted' }),
+      ]);
+      setPendingApplications(pending.applications);
+      setPendingCursor(pending.nextCursor);
+      setAcceptedApplications(accepted);
     } catch (err) {
       console.error('Failed to load applications:', err);
-      setApplications([]);
+      setPendingApplications([]);
+      setPendingCursor(null);
+      setAcceptedApplications([]);
     } finally {
       setIsLoading(false);
     }
   };
 
+  const loadMorePending = async () => {
+    setIsLoadingMore(true);
+    try {
+      const page = await applicationService.getProjectApplications(project.id, {
+        status: 'pending',
+        cursor: pendingCursor,
+      });
+      setPendingApplications(prev => [...prev, ...page.applications]);
+      setPendingCursor(page.nextCursor);
+    } catch (err) {
+      setError(err.message || 'Failed to load more applications');
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   const handleAccept = async (applicationId) => {
     try {
       setError('');
@@ -81,9 +108,6 @@ const ManageProjectModal = ({ project, onClose, onUpdate }) => {
     window.open(`/profile/${userId}`, '_blank');
   };
 
-  const pendingApplications = applications.filter(app => app.status === 'pending');
-  const acceptedApplications = applications.filter(app => app.status === 'accepted');
-
   // Calculate role-wise filled info
   const roleStats = {};
   if (project.roles) {
@@ -187,7 +211,7 @@ const ManageProjectModal = ({ project, onClose, onUpdate }) => {
           <div>
             <h3 className="text-xl font-bold text-gray-800 mb-4 flex items-center gap-2">
               <Users className="w-6 h-6 text-yellow-600" />
-              🟡 Pending Applications ({pendingApplications.length})
+              🟡 Pending Applications ({pendingApplications.length}{pendingCursor ? '+' : ''})
             </h3>
             {isLoading ? (
               <div className="text-center py-8">
@@ -286,6 +310,17 @@ const ManageProjectModal = ({ project, onClose, onUpdate }) => {
                 <p className="text-gray-500">No pending applications</p>
               </div>
             )}
+            {!isLoading && pendingCursor && (
+              <div className="flex justify-center mt-4">
+                <button
+                  onClick={loadMorePending}
+                  disabled={isLoadingMore}
+                  className="px-6 py-2 bg-white rounded-lg border-2 border-orange-300 text-gray-700 font-semibold hover:bg-orange-50 transition disabled:opacity-50"
+                >
+                  {isLoadingMore ? 'Loading...' : 'Load more applicants'}
+                </button>
+              </div>
+            )}
           </div>
 
           {/* Accepted Members */}
@@ -71,8 +71,9 @@ const MyProjects = () => {
       ) : projects.length > 0 ? (
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
           {projects.map((project) => {
-            const pendingCount = project.pending_applications_count || 0;
-            const acceptedCount = project.accepted_members_count || 0;
+            const pendingCount = project.pending_applications || 0;
+            // member_count includes the creator
+            const acceptedCount = Math.max((project.member_count || 1) - 1, 0);
             
             return (
               <div
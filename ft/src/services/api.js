@@ -65,8 +65,14 @@ const attemptTokenRefresh = async () => {
    🌐 MAIN API CALL
 ====================================================== */
 
-export const apiCall = async (endpoint, options = {}) => {
+export const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+
+// withCursor: resolve to { data, nextCursor } for keyset-paginated endpoints,
+// whose next page cursor only comes back in the X-Next-Cursor header
+export const apiCall = async (endpoint, { withCursor = false, ...options } = {}) => {
   const token = localStorage.getItem('access_token');
+  const result = (response, data) =>
+    withCursor ? { data, nextCursor: response.headers.get(NEXT_CURSOR_HEADER) } : data;
 
   const headers = {
     'Content-Type': 'application/json',
@@ -107,7 +113,7 @@ export const apiCall = async (endpoint, options = {}) => {
           });
 
           if (retryResponse.ok) {
-            return await retryResponse.json();
+            return result(retryResponse, await retryResponse.json());
           }
         } catch {
           throw new Error('Session expired. Please login again.');
@@ -140,13 +146,35 @@ export const apiCall = async (endpoint, options = {}) => {
       throw new Error(data.detail || `Request failed (${response.status})`);
     }
 
-    return data;
+    return result(response, data);
   } catch (error) {
     console.error('❌ API Error:', error.message);
     throw error;
   }
 };
 
+// ?a=1&b=2 from the set params, or '' when there are none
+const queryString = (params) => {
+  const query = new URLSearchParams(
+    Object.entries(params).filter(([, value]) => value !== undefined && value !== null && value !== '')
+  ).toString();
+  return query ? `?${query}` : '';
+};
+
+// Follow X-Next-Cursor until the last page and return every item
+export const apiCallAllPages = async (endpoint, options = {}) => {
+  const items = [];
+  let cursor = null;
+  do {
+    const separator = endpoint.includes('?') ? '&' : '?';
+    const page = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+    const { data, nextCursor } = await apiCall(page, { ...options, withCursor: true });
+    items.push(...data);
+    cursor = nextCursor;
+  } while (cursor);
+  return items;
+};
+
 /* ======================================================
    🔐 AUTH SERVICES
 ====================================================== */
@@ -211,14 +239,20 @@ export const projectService = {
 
   getProject: (id) => apiCall(`/projects/${id}`),
 
+  // Project, roles, members, creator and my applications in one request
+  getProjectDetail: (id, include) =>
+    apiCall(`/projects/${id}/detail${include ? `?include=${include.join(',')}` : ''}`),
+
   getMyProjects: () => apiCall('/projects/my/projects'),
 
   // FIXED: Changed from /projects/working to /projects/my/working
   getWorkingProjects: () => apiCall('/projects/my/working'),
 
-  searchProjects: (filters = {}) => {
+  // One page of results; pass nextCursor back as filters.cursor for the next one
+  searchProjects: async (filters = {}) => {
     const params = new URLSearchParams(filters).toString();
-    return apiCall(`/search/projects${params ? `?${params}` : ''}`);
+    const { data, nextCursor } = await apiCall(`/search/projects${params ? `?${params}` : ''}`, { withCursor: true });
+    return { projects: data, nextCursor };
   },
 };
 
@@ -227,9 +261,11 @@ export const projectService = {
 ====================================================== */
 
 export const searchService = {
-  searchUsers: (filters = {}) => {
+  // One page of results; pass nextCursor back as filters.cursor for the next one
+  searchUsers: async (filters = {}) => {
     const params = new URLSearchParams(filters).toString();
-    return apiCall(`/search/users${params ? `?${params}` : ''}`);
+    const { data, nextCursor } = await apiCall(`/search/users${params ? `?${params}` : ''}`, { withCursor: true });
+    return { users: data, nextCursor };
   },
 };
 
@@ -245,12 +281,24 @@ export const applicationService = {
       body: JSON.stringify({ role_id, cover_letter }),
     }),
 
-  // Get my applications (user side)
-  getMyApplications: () => apiCall('/applications/my'),
+  // Get all my applications (user side), newest first, following every page;
+  // params: { status }. Callers count statuses and mark applied roles from the full list
+  getMyApplications: (params = {}) =>
+    apiCallAllPages(`/applications/my${queryString({ limit: 200, ...params })}`),
+
+  // Get one page of a project's applications (creator side), oldest first
+  // params: { status, role_id, limit, cursor }; resolves to { applications, nextCursor }
+  getProjectApplications: async (project_id, params = {}) => {
+    const { data, nextCursor } = await apiCall(
+      `/applications/project/${project_id}${queryString(params)}`,
+      { withCursor: true }
+    );
+    return { applications: data, nextCursor };
+  },
 
-  // Get applications for a specific project (creator side)
-  getProjectApplications: (project_id) =>
-    apiCall(`/applications/project/${project_id}`),
+  // Every page of a project's applications, for bounded lists such as the accepted team
+  getAllProjectApplications: (project_id, params = {}) =>
+    apiCallAllPages(`/applications/project/${project_id}${queryString({ limit: 200, ...params })}`),
 
   // FIXED: Accept an application
   acceptApplication: (application_id) =>
@@ -263,6 +311,13 @@ export const applicationService = {
     apiCall(`/applications/reject/${application_id}`, {
       method: 'POST',
     }),
+
+  // Accept/reject many at once: decisions = [{ application_id, decision: 'accept' | 'reject' }]
+  reviewApplications: (decisions) =>
+    apiCall('/applications/review', {
+      method: 'POST',
+      body: JSON.stringify({ decisions }),
+    }),
 };
 
 /* ======================================================
@@ -13,27 +13,30 @@ export const searchService = {
     try {
       const queryParams = new URLSearchParams();
 
-      // Backend accepts: skill_id, project_type, latitude, longitude, max_distance_km
+      // Backend accepts: skill_id, project_type, latitude, longitude, max_distance_km, sort, limit, cursor
       if (params.skill_id) queryParams.append('skill_id', params.skill_id);
       if (params.project_type) queryParams.append('project_type', params.project_type);
       if (params.latitude) queryParams.append('latitude', params.latitude);
       if (params.longitude) queryParams.append('longitude', params.longitude);
       if (params.max_distance_km) queryParams.append('max_distance_km', params.max_distance_km);
+      if (params.sort) queryParams.append('sort', params.sort);
+      if (params.limit) queryParams.append('limit', params.limit);
+      if (params.cursor) queryParams.append('cursor', params.cursor);
 
       const queryString = queryParams.toString();
       const endpoint = `/search/projects${queryString ? `?${queryString}` : ''}`;
       
       console.log('🔍 Searching projects:', endpoint);
-      const response = await apiCall(endpoint);
+      const { data, nextCursor } = await apiCall(endpoint, { withCursor: true });
       
-      // Backend returns array directly
+      // Backend returns one page as an array; pass nextCursor back as params.cursor for more
       return {
-        projects: Array.isArray(response) ? response : (response.projects || []),
-        total: response.length || 0
+        projects: Array.isArray(data) ? data : [],
+        nextCursor
       };
     } catch (error) {
       console.error('Failed to search projects:', error);
-      return { projects: [], total: 0 };
+      return { projects: [], nextCursor: null };
     }
   },
 
@@ -45,28 +48,32 @@ export const searchService = {
     try {
       const queryParams = new URLSearchParams();
 
-      // Backend accepts: name, profession, skill_id, latitude, longitude, max_distance_km
+      // Backend accepts: name, profession, skill_id, skill_ids, skill_match, latitude, longitude, max_distance_km, limit, cursor
       if (params.name) queryParams.append('name', params.name);
       if (params.profession) queryParams.append('profession', params.profession);
       if (params.skill_id) queryParams.append('skill_id', params.skill_id);
+      (params.skill_ids || []).forEach(id => queryParams.append('skill_ids', id));
+      if (params.skill_match) queryParams.append('skill_match', params.skill_match);
       if (params.latitude) queryParams.append('latitude', params.latitude);
       if (params.longitude) queryParams.append('longitude', params.longitude);
       if (params.max_distance_km) queryParams.append('max_distance_km', params.max_distance_km);
+      if (params.limit) queryParams.append('limit', params.limit);
+      if (params.cursor) queryParams.append('cursor', params.cursor);
 
       const queryString = queryParams.toString();
       const endpoint = `/search/users${queryString ? `?${queryString}` : ''}`;
       
       console.log('🔍 Searching users:', endpoint);
-      const response = await apiCall(endpoint);
+      const { data, nextCursor } = await apiCall(endpoint, { withCursor: true });
       
-      // Backend returns array directly
+      // Backend returns one page as an array; pass nextCursor back as params.cursor for more
       return {
-        users: Array.isArray(response) ? response : (response.users || []),
-        total: response.length || 0
+        users: Array.isArray(data) ? data : [],
+        nextCursor
       };
     } catch (error) {
       console.error('Failed to search users:', error);
-      return { users: [], total: 0 };
+      return { users: [], nextCursor: null };
     }
   },
 
@@ -85,32 +92,59 @@ export const searchService = {
 
   /**
    * Get popular skills
-   * Mock implementation - backend doesn't have this endpoint
+   * Matches backend: GET /search/popular-skills (sort: open_slots | holders)
+   * `facets` keeps the per-skill open_slots / holders counts for filter badges
    */
-  getPopularSkills: async (limit = 20) => {
+  getPopularSkills: async (limit = 20, sort = 'open_slots') => {
     try {
-      // Get all skills and return first N as "popular"
-      const skills = await apiCall('/skills/list');
-      const skillsArray = Array.isArray(skills) ? skills : (skills.skills || []);
-      
+      const queryParams = new URLSearchParams({ sort });
+      if (limit) queryParams.append('limit', limit);
+
+      const response = await apiCall(`/search/popular-skills?${queryParams.toString()}`);
+      const facets = response.skills || [];
+
       return {
-        skills: skillsArray.slice(0, limit).map(s => s.name)
+        skills: facets.map(s => s.name),
+        facets
       };
     } catch (error) {
       console.error('Failed to get popular skills:', error);
-      return { skills: [] };
+      return { skills: [], facets: [] };
+    }
+  },
+
+  /**
+   * Get the "projects for me" feed for the logged-in user
+   * Matches backend: GET /search/feed (max_distance_km, limit)
+   */
+  getProjectFeed: async (params = {}) => {
+    try {
+      const queryParams = new URLSearchParams();
+      if (params.max_distance_km) queryParams.append('max_distance_km', params.max_distance_km);
+      if (params.limit) queryParams.append('limit', params.limit);
+
+      const queryString = queryParams.toString();
+      const response = await apiCall(`/search/feed${queryString ? `?${queryString}` : ''}`);
+      return { projects: Array.isArray(response) ? response : [] };
+    } catch (error) {
+      console.error('Failed to get project feed:', error);
+      return { projects: [] };
     }
   },
 
   /**
    * Get search suggestions (autocomplete)
-   * Mock implementation - backend doesn't have this endpoint
+   * Matches backend: GET /search/suggestions (types: skills, projects, professions)
    */
   getSearchSuggestions: async (query, type = 'projects') => {
     try {
-      // For now, return empty - could implement client-side filtering
-      console.log('Search suggestions not implemented on backend');
-      return { suggestions: [] };
+      const queryParams = new URLSearchParams({ q: query });
+      if (type) queryParams.append('type', type === 'users' ? 'professions' : type);
+
+      const response = await apiCall(`/search/suggestions?${queryParams.toString()}`);
+      return {
+        suggestions: (response.suggestions || []).map(s => s.text)
+      };
     } catch (error) {
       console.error('Failed to get suggestions:', error);
       return { suggestions: [] };
@@ -198,9 +232,10 @@ export const searchService = {
  * BACKEND ENDPOINTS AVAILABLE:
  * ✅ GET /search/projects - Search projects
  * ✅ GET /search/users    - Search users
+ * ✅ GET /search/suggestions - Autocomplete suggestions
+ * ✅ GET /search/popular-skills - Popular skills with counts
+ * ✅ GET /search/feed     - Projects matching my skills
  * 
  * BACKEND ENDPOINTS NEEDED:
- * ❌ GET /search/suggestions      - Autocomplete suggestions
  * ❌ GET /search/locations        - Location suggestions
- * ❌ GET /search/popular-skills   - Popular skills with counts
  */
\ No newline at end of file